@@ -6,12 +6,28 @@ import aiohttp
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from rate_limiter import RateLimiter
+
 class DiscordPosterV2:
     """Enhanced Discord poster with tier-based portfolio formatting."""
     
-    def __init__(self, webhooks: Dict[str, str]):
-        """Initialize with Discord webhook URLs."""
+    def __init__(self, webhooks: Dict[str, str], session: Optional[aiohttp.ClientSession] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """Initialize with Discord webhook URLs, an optional shared HTTP session and rate limiter.
+        
+        Pass the bot's Discord limiter so both share each webhook's bucket.
+        """
         self.webhooks = webhooks
+        self.session = session
+        self.rate_limiter = rate_limiter or RateLimiter(rate=2.5, burst=5)
+    
+    async def _post(self, webhook_url: str, payload: Dict) -> int:
+        """POST a payload within the webhook's rate limit, reusing the shared session when one was provided."""
+        if self.session is not None:
+            return await self.rate_limiter.post(self.session, webhook_url, webhook_url, payload)
+        
+        async with aiohttp.ClientSession() as session:
+            return await self.rate_limiter.post(session, webhook_url, webhook_url, payload)
     
     async def post_message(self, content: str, title: Optional[str] = None, webhook_key: str = 'default'):
         """Post a simple message to Discord."""
@@ -31,10 +47,9 @@ class DiscordPosterV2:
         payload = {"embeds": [embed]}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status != 204:
-                        print(f"Discord webhook error: {response.status}")
+            status = await self._post(webhook_url, payload)
+            if status != 204:
+                print(f"Discord webhook error: {status}")
         except Exception as e:
             print(f"Error posting to Discord: {e}")
     
@@ -115,10 +130,9 @@ Preise abgerufen: {summary['prices_fetched']}
             payload = {"embeds": embeds[:10]}
             
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(webhook_url, json=payload) as response:
-                        if response.status != 204:
-                            print(f"Discord webhook error: {response.status}")
+                status = await self._post(webhook_url, payload)
+                if status != 204:
+                    print(f"Discord webhook error: {status}")
             except Exception as e:
                 print(f"Error posting portfolio to Discord: {e}")
     
@@ -150,10 +164,9 @@ Preise abgerufen: {summary['prices_fetched']}
         payload = {"embeds": [embed]}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status != 204:
-                        print(f"Discord webhook error: {response.status}")
+            status = await self._post(webhook_url, payload)
+            if status != 204:
+                print(f"Discord webhook error: {status}")
         except Exception as e:
             print(f"Error posting critical signals to Discord: {e}")
 
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Scoring Benchmark - Offline benchmark for the feed parse/filter/score/sort path
+Generates synthetic RSS/Atom feeds and writes per-stage timings as JSON
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Callable, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+import feedparser
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ffi_crypto_bot import FFICryptoNewsBot, np
+
+# Title fragments mixing crypto and non-crypto vocabulary so every filter branch is exercised
+SUBJECTS = ['Bitcoin', 'Ethereum', 'Solana', 'Cardano', 'Polkadot', 'XRP', 'Chainlink', 'Polygon',
+            'Arbitrum', 'Binance', 'Coinbase', 'BlackRock', 'The SEC', 'A DeFi protocol', 'A DAO',
+            'The city council', 'A football club', 'The weather service']
+EVENTS = ['surges after ETF approval', 'falls as regulation concerns grow', 'announces partnership',
+          'suffers exploit in breaking hack', 'schedules upgrade for this week', 'sees whale trading volume spike',
+          'faces lawsuit today', 'rally continues', 'publishes daily roundup', 'recap of last week',
+          'opens new office', 'reports quarterly results']
+DETAILS = ['Analysts expect institutional adoption to accelerate.',
+           'Traders watched the price closely as liquidity dried up.',
+           'The method update was announced just in time for the market open.',
+           'Staking yields and mining difficulty both moved higher.',
+           'Officials said more information would follow soon.',
+           'Local residents were asked to stay indoors.']
+
+
+def generate_feed(path: str, entries: int, feed_format: str, seed: int = 8) -> None:
+    """Write a synthetic RSS 2.0 or Atom document with the given number of entries."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        if feed_format == 'atom':
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n'
+                    '<feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic</title>\n')
+        else:
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n'
+                    '<rss version="2.0"><channel><title>Synthetic</title>\n')
+        
+        for index in range(entries):
+            title = escape(f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)}")
+            summary = escape(' '.join(rng.sample(DETAILS, 3)))
+            link = f"https://news.example.com/{index}/story-{rng.randrange(10 ** 9)}"
+            # Newest first, spread over the last two hours so the recency filter keeps about half
+            published = (now - timedelta(seconds=index * 7200 / max(entries, 1))).replace(microsecond=0)
+            
+            if feed_format == 'atom':
+                f.write(f'<entry><title>{title}</title><link href="{link}"/><id>{link}</id>'
+                        f'<published>{published.isoformat()}</published><updated>{published.isoformat()}</updated>'
+                        f'<summary>{summary}</summary></entry>\n')
+            else:
+                f.write(f'<item><title>{title}</title><link>{link}</link>'
+                        f'<pubDate>{format_datetime(published)}</pubDate>'
+                        f'<description>{summary}</description></item>\n')
+        
+        f.write('</feed>\n' if feed_format == 'atom' else '</channel></rss>\n')
+
+
+def measure(stage: Callable, items: int, trace_memory: bool) -> Tuple[object, Dict]:
+    """Run one stage with bot logging silenced; return its result and timing/memory figures.
+    
+    Peak memory comes from a second, traced run so tracemalloc overhead never
+    distorts the timing.
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = stage()
+    seconds = time.perf_counter() - start
+    
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    return result, {
+        'items': items,
+        'seconds': round(seconds, 6),
+        'entries_per_sec': round(items / seconds, 1) if seconds > 0 else None,
+        'peak_memory_bytes': peak
+    }
+
+
+def run_case(bot: FFICryptoNewsBot, path: str, entries: int, feed_format: str, trace_memory: bool) -> Dict:
+    """Benchmark the parse, filter, score, sort and score_batch stages for one synthetic feed."""
+    credibility = 4
+    stages = {}
+    
+    feed, stages['parse'] = measure(lambda: feedparser.parse(path), entries, trace_memory)
+    
+    def filter_stage() -> List[Dict]:
+        candidates = []
+        for entry in feed.entries:
+            article = bot.filter_entry(entry, 'Synthetic', credibility)
+            if article is not None:
+                candidates.append(article)
+        return candidates
+    
+    candidates, stages['filter'] = measure(filter_stage, len(feed.entries), trace_memory)
+    
+    def score_stage() -> List[Dict]:
+        for article in candidates:
+            article.update(bot.calculate_significance_score(article, credibility))
+        return candidates
+    
+    scored, stages['score'] = measure(score_stage, len(candidates), trace_memory)
+    ranked, stages['sort'] = measure(lambda: bot.rank_articles(scored), len(scored), trace_memory)
+    
+    # Vectorised alternative to score + sort + top-N, as used by FFICryptoNewsBot.run
+    _, stages['score_batch'] = measure(lambda: bot.score_batch(candidates), len(candidates), trace_memory)
+    
+    return {
+        'format': feed_format,
+        'entries': entries,
+        'file_bytes': os.path.getsize(path),
+        'candidates': len(candidates),
+        'ranked': len(ranked),
+        'stages': stages
+    }
+
+
+def git_revision() -> str:
+    """Current commit hash, so result files from different commits can be diffed."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark feed parsing and significance scoring offline.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000, 100000],
+                        help='entry counts per synthetic feed')
+    parser.add_argument('--formats', nargs='+', choices=['rss', 'atom'], default=['rss', 'atom'])
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON results file')
+    parser.add_argument('--no-memory', action='store_true', help='skip the traced peak-memory runs')
+    args = parser.parse_args()
+    
+    output = os.path.abspath(args.output)
+    results = []
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        # The bot keeps its state files in the working directory; keep them out of the repo
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            bot = FFICryptoNewsBot()
+        
+        for feed_format in args.formats:
+            for entries in args.sizes:
+                path = os.path.join(workdir, f"synthetic_{entries}.{feed_format}.xml")
+                generate_feed(path, entries, feed_format)
+                case = run_case(bot, path, entries, feed_format, not args.no_memory)
+                results.append(case)
+                
+                timings = ', '.join(f"{stage} {figures['seconds'] * 1000:.1f} ms"
+                                    for stage, figures in case['stages'].items())
+                print(f"{feed_format:>4} {entries:>7} entries: {timings}")
+    
+    report = {
+        'revision': git_revision(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'feedparser': feedparser.__version__,
+        'numpy': np.__version__ if np is not None else None,
+        'results': results
+    }
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Dedup Store - Bounded, time-ordered index of delivered article URLs
+Append-only JSON lines on disk with periodic compaction
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click, never identify the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'ref', 'ref_src', 'cmpid', 'guccounter', 'guce_referrer', 'guce_referrer_sig'
+}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of an article URL for duplicate checks.
+    
+    Lowercases scheme and host, drops the fragment, UTM and other tracking
+    parameters and trailing slashes, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+class DedupStore:
+    """Set-like store of processed article URLs with insertion timestamps and age/size eviction.
+    
+    >>> import os, tempfile, time
+    >>> tmp = tempfile.TemporaryDirectory()
+    >>> path = os.path.join(tmp.name, 'processed.jsonl')
+    >>> store = DedupStore(path, max_entries=3, compact_every=2)
+    >>> store.update(['https://a.com/1', 'https://a.com/2'])
+    >>> store.flush()
+    2
+    >>> store.update(['https://a.com/3', 'https://a.com/4', 'https://a.com/5'])
+    >>> len(store), 'https://a.com/2' in store, 'https://a.com/3' in store
+    (3, False, True)
+    >>> store.add('https://a.com/6', timestamp=time.time() - 31 * 86400)
+    >>> 'https://a.com/6' in store
+    False
+    
+    New records are appended until the log holds compact_every superseded
+    ones; then it is rewritten with the live entries only:
+    
+    >>> store.flush()
+    3
+    >>> store.add('https://a.com/7')
+    >>> store.flush(), sum(1 for line in open(path))
+    (3, 3)
+    
+    A record torn by an interrupted run is skipped, and does not swallow
+    the next one appended:
+    
+    >>> with open(path, 'a') as f:
+    ...     _ = f.write('{"url": "https://a.com/8", "t')
+    >>> store = DedupStore(path, max_entries=3)
+    >>> len(store), 'HTTPS://A.com/7/?utm_source=feed#top' in store
+    (3, True)
+    >>> store.add('https://a.com/9')
+    >>> store.flush(), 'https://a.com/9' in DedupStore(path)
+    (1, True)
+    >>> tmp.cleanup()
+    """
+    
+    def __init__(self, path: str, max_entries: int = 5000, max_age_days: int = 30, compact_every: int = 500):
+        """Configure the store. Nothing is read from disk until the first lookup."""
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+        self.compact_every = compact_every
+        
+        self._entries: Optional[OrderedDict] = None  # normalized URL -> first seen (epoch seconds)
+        self._pending = []  # records not yet appended to disk
+        self._file_records = 0  # records currently in the file, including superseded ones
+        self._torn = False  # the file ends in a partial line
+        self._lock = threading.Lock()  # parse workers look up while the event loop adds
+    
+    def _load(self):
+        """Read the log once; later records for the same URL win."""
+        if self._entries is not None:
+            return
+        
+        entries = {}
+        records = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                for line in f:
+                    self._torn = not line.endswith('\n')
+                    try:
+                        record = json.loads(line)
+                        entries[record['url']] = float(record['ts'])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # torn write from an interrupted run
+                    records += 1
+        
+        self._entries = OrderedDict(sorted(entries.items(), key=lambda item: item[1]))
+        self._file_records = records
+        self._evict()
+    
+    def _evict(self):
+        """Drop entries past the age limit, then the oldest beyond max_entries."""
+        cutoff = time.time() - self.max_age_seconds
+        while self._entries and (next(iter(self._entries.values())) < cutoff
+                                 or len(self._entries) > self.max_entries):
+            self._entries.popitem(last=False)
+    
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            self._load()
+            return normalize_url(url) in self._entries
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
+    
+    def add(self, url: str, timestamp: Optional[float] = None):
+        """Record a URL as processed (kept in memory until flush)."""
+        with self._lock:
+            self._load()
+            key = normalize_url(url)
+            seen = time.time() if timestamp is None else timestamp
+            # Already past the age limit: eviction only looks at the oldest end
+            if key in self._entries or seen < time.time() - self.max_age_seconds:
+                return
+            self._entries[key] = seen
+            self._pending.append({'url': key, 'ts': round(seen, 3)})
+            self._evict()
+    
+    def update(self, urls: Iterable[str], timestamp: Optional[float] = None):
+        """Record several URLs, e.g. when migrating the old JSON list."""
+        for url in urls:
+            self.add(url, timestamp)
+    
+    def flush(self) -> int:
+        """Append new records to disk, compacting the log when it has grown too far.
+        
+        Returns the number of records written.
+        """
+        with self._lock:
+            if self._entries is None:
+                return 0
+            
+            if self._file_records + len(self._pending) > len(self._entries) + self.compact_every:
+                return self._compact()
+            
+            if self._pending:
+                with open(self.path, 'a') as f:
+                    if self._torn:
+                        f.write('\n')  # keep the first new record off the torn line
+                        self._torn = False
+                    f.writelines(json.dumps(record) + '\n' for record in self._pending)
+                self._file_records += len(self._pending)
+            
+            written = len(self._pending)
+            self._pending = []
+            return written
+    
+    def _compact(self) -> int:
+        """Rewrite the log with only the live entries."""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.writelines(json.dumps({'url': url, 'ts': round(seen, 3)}) + '\n'
+                         for url, seen in self._entries.items())
+        os.replace(temp_path, self.path)
+        
+        self._file_records = len(self._entries)
+        self._torn = False
+        self._pending = []
+        return self._file_records
@@ -0,0 +1,65 @@
+"""
+Feed Dates - Entry timestamp normalization
+Turns feed dates into UTC epoch seconds once per entry so filters compare integers
+"""
+
+import calendar
+from datetime import datetime, timezone
+from email.utils import parsedate_tz
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(text: str) -> Optional[int]:
+    """UTC epoch seconds for an RFC 822 or ISO 8601 date string, or None.
+    
+    Offsets are converted, not dropped; dates without one are taken as UTC.
+    Memoized because feeds repeat the same dates on every poll.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    
+    # RFC 822 (RSS pubDate): "Wed, 01 Jan 2025 10:00:00 +0100" / "01 Jan 2025 10:00 GMT"
+    if text[4:5] != '-':
+        parsed = parsedate_tz(text)
+        if parsed is None:
+            return None
+        return calendar.timegm(parsed[:9]) - (parsed[9] or 0)
+    
+    # ISO 8601 (Atom): "2025-01-01T10:00:00Z", "2025-01-01T10:00:00.123+01:00"
+    try:
+        if text.endswith(('Z', 'z')):
+            text = text[:-1] + '+00:00'
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+def entry_timestamp(entry) -> Optional[int]:
+    """Published (or updated) time of a feed entry as UTC epoch seconds, or None.
+    
+    Prefers feedparser's already-parsed UTC struct_time over re-parsing the string.
+    """
+    for field in ('published', 'updated'):
+        parsed = getattr(entry, field + '_parsed', None)
+        if parsed:
+            return calendar.timegm(parsed)
+        text = getattr(entry, field, None)
+        timestamp = parse_timestamp(text) if text else None
+        if timestamp is not None:
+            return timestamp
+    return None
+
+
+def describe_age(seconds: int) -> str:
+    """Human-readable age, e.g. "42 minutes old"."""
+    if seconds < 3600:
+        return f"{seconds // 60} minutes old"
+    if seconds < 86400:
+        return f"{seconds // 3600} hours old"
+    return f"{seconds // 86400} days old"
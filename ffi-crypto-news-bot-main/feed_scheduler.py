@@ -0,0 +1,53 @@
+"""
+Feed Scheduler - Adaptive per-feed polling intervals
+Learns each source's publishing cadence from entry timestamps and backs off on quiet feeds
+"""
+
+import random
+from statistics import median
+from typing import Dict, List
+
+
+class FeedScheduler:
+    """Picks each feed's next poll interval from its observed publish rate.
+    
+    Learned values live in the feed's state dict ('publish_gap', 'quiet_polls',
+    'poll_interval'), which the bot saves with the rest of its feed state.
+    """
+    
+    def __init__(self, default_interval: float = 600, min_interval: float = 120, max_interval: float = 3600,
+                 backoff: float = 1.5, smoothing: float = 0.3, jitter: float = 0.1):
+        """Intervals are in seconds; smoothing is the weight of the newest gap sample."""
+        self.default_interval = default_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.jitter = jitter
+    
+    def observe(self, state: Dict, timestamps: List[int], fresh_entries: int) -> float:
+        """Update a feed's cadence from one poll and return its next interval.
+        
+        timestamps are the entry publish times seen in this poll (any order);
+        fresh_entries is how many of them were new. Polls that bring nothing
+        new stretch the interval by `backoff` each time.
+        """
+        ordered = sorted(set(timestamps), reverse=True)[:20]
+        gaps = [newer - older for newer, older in zip(ordered, ordered[1:])]
+        if gaps:
+            sample = median(gaps)
+            gap = state.get('publish_gap')
+            state['publish_gap'] = round(sample if gap is None else gap + self.smoothing * (sample - gap), 1)
+        
+        state['quiet_polls'] = 0 if fresh_entries else state.get('quiet_polls', 0) + 1
+        
+        # Poll about twice per typical gap between articles
+        base = state['publish_gap'] / 2 if state.get('publish_gap') else self.default_interval
+        interval = base * self.backoff ** min(state['quiet_polls'], 10)
+        state['poll_interval'] = round(min(max(interval, self.min_interval), self.max_interval))
+        return state['poll_interval']
+    
+    def next_delay(self, state: Dict) -> float:
+        """Seconds until the feed's next poll, with jitter so feeds drift apart."""
+        interval = state.get('poll_interval', self.default_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
@@ -4,19 +4,73 @@ FFI Crypto News Bot - Module 8 Enhanced Edition
 Advanced news analysis with significance scoring, credibility ratings, and smart article selection
 """
 
+import argparse
 import asyncio
 import aiohttp
 import feedparser
 import json
+import logging
 import os
+import random
+import signal
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.etree.ElementTree import ParseError
 
-# Simple print-based logging
-def log(message):
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    print(f"{timestamp} - {message}")
+try:
+    import numpy as np
+except ImportError:  # score_batch falls back to per-article scoring
+    np = None
+
+from dedup_store import DedupStore, normalize_url
+from feed_dates import describe_age, entry_timestamp
+from feed_scheduler import FeedScheduler
+from keyword_matcher import KeywordMatcher
+from metrics import Metrics
+from outbox import Outbox
+from profiling import Profiler
+from rate_limiter import RateLimiter
+from stream_parser import CHUNK_SIZE, StreamingFeedParser
+from story_clusterer import StoryClusterer, title_sketch
+from story_index import StoryIndex
+from structured_logging import setup_logging
+from translation_cache import TranslationCache
+
+# Keyword categories that feed the significance score (columns of the score_batch hit matrix)
+SCORE_CATEGORIES = [
+    'impact_high', 'impact_medium_high', 'impact_medium',
+    'relevance_major', 'relevance_altcoin', 'relevance_popular',
+    'positive', 'negative',
+    'time_immediate', 'time_short', 'time_medium'
+]
+
+TRANSLATION_MODEL = "gpt-4o-mini"
+
+TRANSLATION_SYSTEM_PROMPT = (
+    "You are a professional translator. Translate the following text to German. "
+    "Keep technical terms and proper nouns in their original form when appropriate. "
+    "Provide only the German translation."
+)
+
+BATCH_TRANSLATION_SYSTEM_PROMPT = (
+    "You are a professional translator. You receive a JSON array of objects with an "
+    "\"id\" and a \"text\" field. Translate every \"text\" to German. Keep technical terms "
+    "and proper nouns in their original form when appropriate. Reply with only a JSON "
+    "array of objects with the same \"id\" values and the German translation in \"text\"."
+)
+
+# Discord webhook message limits
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_MESSAGE_CHARS = 6000  # summed over all embeds of one message
+
+logger = logging.getLogger('ffi_crypto_bot')
+
+# Leveled logging; main() routes it through a queue to a writer thread.
+# Keyword fields become keys of the JSON line with LOG_FORMAT=json.
+def log(message, level=logging.INFO, **fields):
+    logger.log(level, message, extra={'fields': fields} if fields else None)
 
 class FFICryptoNewsBot:
     """Enhanced crypto news bot with Module 8 advanced news analysis."""
@@ -31,9 +85,82 @@ class FFICryptoNewsBot:
             'openai_api_key': os.getenv('OPENAI_API_KEY', ''),
             'max_articles': int(os.getenv('MAX_ARTICLES_PER_RUN', '8')),
             'hours_lookback': int(os.getenv('HOURS_LOOKBACK', '1')),
-            'min_significance_score': float(os.getenv('MIN_SIGNIFICANCE_SCORE', '2.0'))
+            'max_lookback_hours': int(os.getenv('MAX_LOOKBACK_HOURS', '24')),
+            'feed_poll_interval': int(os.getenv('FEED_POLL_INTERVAL', '600')),
+            'feed_poll_min_interval': int(os.getenv('FEED_POLL_MIN_INTERVAL', '120')),
+            'feed_poll_max_interval': int(os.getenv('FEED_POLL_MAX_INTERVAL', '3600')),
+            'feed_poll_jitter': float(os.getenv('FEED_POLL_JITTER', '0.1')),
+            'daemon_batch_delay': float(os.getenv('DAEMON_BATCH_DELAY', '30')),
+            'portfolio_interval_hours': float(os.getenv('PORTFOLIO_INTERVAL_HOURS', '12')),
+            'min_significance_score': float(os.getenv('MIN_SIGNIFICANCE_SCORE', '2.0')),
+            'http_pool_limit': int(os.getenv('HTTP_POOL_LIMIT', '20')),
+            'http_pool_limit_per_host': int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '4')),
+            'feed_parse_workers': int(os.getenv('FEED_PARSE_WORKERS', '4')),
+            'feed_parser': os.getenv('FEED_PARSER', 'feedparser'),  # or 'stream'
+            'translation_concurrency': int(os.getenv('TRANSLATION_CONCURRENCY', '4')),
+            'translation_mode': os.getenv('TRANSLATION_MODE', 'batch'),
+            'discord_delivery': os.getenv('DISCORD_DELIVERY', 'batch'),
+            'translation_batch_token_budget': int(os.getenv('TRANSLATION_BATCH_TOKEN_BUDGET', '3000')),
+            'translation_cache_file': os.getenv('TRANSLATION_CACHE_FILE', 'translation_cache.db'),
+            'translation_cache_max_entries': int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', '5000')),
+            'translation_cache_ttl_days': int(os.getenv('TRANSLATION_CACHE_TTL_DAYS', '30')),
+            'dedup_max_entries': int(os.getenv('DEDUP_MAX_ENTRIES', '5000')),
+            'dedup_max_age_days': int(os.getenv('DEDUP_MAX_AGE_DAYS', '30')),
+            'dedup_compact_every': int(os.getenv('DEDUP_COMPACT_EVERY', '500')),
+            'cluster_min_similarity': float(os.getenv('CLUSTER_MIN_SIMILARITY', '0.7')),
+            'story_index_window_days': int(os.getenv('STORY_INDEX_WINDOW_DAYS', '14')),
+            'story_index_min_similarity': float(os.getenv('STORY_INDEX_MIN_SIMILARITY', '0.8')),
+            'discord_rate': float(os.getenv('DISCORD_RATE', '2.5')),
+            'discord_burst': int(os.getenv('DISCORD_BURST', '5')),
+            'discord_target_timeout': float(os.getenv('DISCORD_TARGET_TIMEOUT', '30')),
+            'outbox_file': os.getenv('OUTBOX_FILE', 'delivery_outbox.db'),
+            'outbox_max_attempts': int(os.getenv('OUTBOX_MAX_ATTEMPTS', '6')),
+            'outbox_retry_base': float(os.getenv('OUTBOX_RETRY_BASE', '5')),
+            'outbox_retry_max': float(os.getenv('OUTBOX_RETRY_MAX', '900')),
+            'outbox_drain_wait': float(os.getenv('OUTBOX_DRAIN_WAIT', '60')),
+            'profile_file': os.getenv('PROFILE_FILE', 'run_profile.jsonl'),
+            'metrics_port': int(os.getenv('METRICS_PORT', '0')),
+            'metrics_host': os.getenv('METRICS_HOST', '127.0.0.1'),
+            'telegram_rate': float(os.getenv('TELEGRAM_RATE', '1.0')),
+            'telegram_burst': int(os.getenv('TELEGRAM_BURST', '1'))
         }
         
+        # Feed parsing and entry scoring run here instead of on the event loop
+        self.parse_executor = ThreadPoolExecutor(max_workers=self.config['feed_parse_workers'],
+                                                 thread_name_prefix='feed-parse')
+        
+        # Per-source fetch statistics for the current run
+        self.feed_stats = {}
+        
+        # Counters and histograms, served on METRICS_PORT in daemon mode
+        self.metrics = Metrics()
+        self.metrics.histogram('feed_fetch_seconds', 'RSS feed fetch latency by feed')
+        self.metrics.counter('feed_fetches', 'RSS feed fetches by feed and HTTP status')
+        self.metrics.counter('entries_seen', 'Feed entries examined by feed')
+        self.metrics.counter('entries_filtered', 'Feed entries rejected by filter stage')
+        self.metrics.counter('articles_delivered', 'Articles delivered by destination')
+        self.metrics.counter('delivery_responses', 'Delivery HTTP responses by destination and status')
+        self.metrics.counter('rate_limited', '429 responses by destination, including retried ones')
+        self.metrics.counter('translation_cache_lookups', 'Translation cache lookups by result')
+        self.metrics.counter('openai_tokens', 'OpenAI tokens used by kind')
+        self.metrics.histogram('price_fetch_seconds', 'CoinGecko price fetch latency')
+        
+        # Token buckets per webhook URL / Telegram chat; server rate-limit headers refine them
+        self.discord_limiter = RateLimiter(self.config['discord_rate'], self.config['discord_burst'],
+                                           on_throttle=self.count_throttle)
+        self.telegram_limiter = RateLimiter(self.config['telegram_rate'], self.config['telegram_burst'],
+                                            on_throttle=self.count_throttle)
+        
+        # Every (article, destination) send is recorded here before it is attempted
+        self.outbox = Outbox(
+            self.config['outbox_file'],
+            max_attempts=self.config['outbox_max_attempts'],
+            base_delay=self.config['outbox_retry_base'],
+            max_delay=self.config['outbox_retry_max']
+        )
+        if self.outbox.recovered:
+            log(f"Outbox: requeued {self.outbox.recovered} delivery(ies) interrupted by the last shutdown")
+        
         # Collect all Discord webhooks
         self.discord_webhooks = []
         if self.config['discord_webhook']:
@@ -77,14 +204,113 @@ class FFICryptoNewsBot:
             'blockchain', 'defi', 'nft', 'altcoin', 'solana', 'cardano', 
             'polkadot', 'chainlink', 'dogecoin', 'shiba', 'matic', 'polygon',
             'binance', 'coinbase', 'trading', 'hodl', 'mining', 'staking',
-            'web3', 'metaverse', 'dao', 'yield', 'liquidity', 'dex', 'cefi'
+            'web3', 'metaverse', 'dao', 'yield', 'liquidity', 'dex', 'cefi',
+            'stablecoin'
         ]
         
-        # Load processed articles
+        # Every keyword list used for filtering and scoring, matched in one pass
+        self.keyword_categories = {
+            'crypto': self.crypto_keywords,
+            # Market impact tiers (score 5 / 4 / 3)
+            'impact_high': ['sec', 'regulation', 'ban', 'approval', 'etf', 'lawsuit',
+                            'hack', 'exploit', 'breach', 'shutdown', 'halving', 'merge'],
+            'impact_medium_high': ['blackrock', 'fidelity', 'institutional', 'adoption',
+                                   'partnership', 'integration', 'upgrade', 'fork'],
+            'impact_medium': ['binance', 'coinbase', 'exchange', 'trading', 'volume',
+                              'price', 'market cap', 'whale'],
+            # Relevance tiers (score 5 / 4 / 3)
+            'relevance_major': ['bitcoin', 'btc', 'ethereum', 'eth', 'crypto market', 'cryptocurrency market'],
+            'relevance_altcoin': ['solana', 'cardano', 'polkadot', 'xrp', 'chainlink'],
+            'relevance_popular': ['avalanche', 'polygon', 'matic', 'arbitrum', 'optimism'],
+            # Sentiment
+            'positive': ['surge', 'rally', 'bull', 'gain', 'rise', 'up', 'high', 'moon',
+                         'breakthrough', 'adoption', 'partnership', 'launch', 'upgrade',
+                         'soar', 'jump', 'spike', 'boom', 'success'],
+            'negative': ['crash', 'dump', 'bear', 'fall', 'drop', 'down', 'low', 'hack',
+                         'ban', 'regulation', 'concern', 'warning', 'risk', 'decline',
+                         'plunge', 'collapse', 'fail', 'scam', 'fraud'],
+            # Time urgency tiers (score 5 / 4 / 3)
+            'time_immediate': ['breaking', 'just in', 'alert', 'emergency', 'now'],
+            'time_short': ['today', 'announced', 'hours ago', 'this morning'],
+            'time_medium': ['this week', 'upcoming', 'soon', 'scheduled'],
+            # Articles ABOUT old events, even if recently published
+            'old_event': [
+                # Past time references
+                'yesterday', 'gestern', 'einen tag nach', 'one day after',
+                'last week', 'letzte woche', 'days ago', 'vor tagen',
+                'last month', 'letzten monat', 'weeks ago', 'vor wochen',
+                # Daily summaries and newsletters
+                'tagesnachrichten', 'daily news', 'the daily', 'newsletter',
+                'daily roundup', 'roundup', 'zusammenfassung', 'wochentagnachmittagen',
+                'weekly roundup', 'wochenrückblick', 'recap', 'rückblick'
+            ]
+        }
+        # Stems that also match longer words: "cryptos", "bitcoiners", "stablecoins"
+        self.keyword_matcher = KeywordMatcher(self.keyword_categories,
+                                              prefix_stems=['crypto', 'bitcoin', 'stablecoin'])
+        
+        # Load run state; the processed-article index itself is read on first lookup
         self.processed_file = 'processed_articles.json'
         self.processed_articles = self.load_processed_articles()
+        self.story_clusterer = StoryClusterer(self.config['cluster_min_similarity'])
+        self.story_index = StoryIndex(
+            'delivered_stories.bin',
+            window_days=self.config['story_index_window_days'],
+            min_similarity=self.config['story_index_min_similarity']
+        )
+        
+        # Per-entry filters, cheapest and most selective first: on the 12-hour
+        # cron most entries were already processed and never reach the text work
+        self.filter_stages = [
+            ('processed', self.filter_processed),
+            ('recency', self.filter_recency),
+            ('crypto', self.filter_crypto),
+            ('old_event', self.filter_old_event),
+            ('delivered', self.filter_delivered)
+        ]
+        self.filter_stats = {stage: {'entries': 0, 'rejected': 0, 'seconds': 0.0}
+                             for stage, _ in self.filter_stages}
+        
+        # Learns each feed's polling interval; persisted in feed_state
+        self.feed_scheduler = FeedScheduler(
+            default_interval=self.config['feed_poll_interval'],
+            min_interval=self.config['feed_poll_min_interval'],
+            max_interval=self.config['feed_poll_max_interval'],
+            jitter=self.config['feed_poll_jitter']
+        )
         
-        log(f"Loaded {len(self.processed_articles)} processed articles")
+        # Timing spans per stage, written to PROFILE_FILE after each run
+        self.profiler = Profiler()
+        
+        # Translation cache lives next to the processed articles state
+        self.translation_cache = TranslationCache(
+            os.path.join(os.path.dirname(self.processed_file), self.config['translation_cache_file']),
+            max_entries=self.config['translation_cache_max_entries'],
+            ttl_days=self.config['translation_cache_ttl_days']
+        )
+        
+        # Needs the webhooks, the dedup store and the story index set up above
+        self.retire_unconfigured_deliveries()
+    
+    def destination_name(self, key: str) -> str:
+        """Metrics label for a rate limiter key, so webhook URLs never show up in metrics."""
+        for webhook_name, webhook_url in self.discord_webhooks:
+            if key == webhook_url:
+                return f"discord:{webhook_name}"
+        return 'telegram'
+    
+    def count_throttle(self, key: str):
+        self.metrics.inc('rate_limited', destination=self.destination_name(key))
+    
+    def create_http_session(self) -> aiohttp.ClientSession:
+        """Create the pooled HTTP session shared by every fetch and send path of a run."""
+        connector = aiohttp.TCPConnector(
+            limit=self.config['http_pool_limit'],
+            limit_per_host=self.config['http_pool_limit_per_host'],
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(connector=connector)
     
     async def load_portfolio_from_csv(self) -> Dict:
         """Load portfolio from notion_portfolio.csv with correct Sicherheitspolster handling"""
@@ -155,9 +381,9 @@ class FFICryptoNewsBot:
             total_coins = sum(len(t['coins']) for t in tiers.values())
             log(f"Loaded portfolio: {total_coins} coins across 4 tiers")
             return tiers
-            
+        
         except Exception as e:
-            log(f"Error loading portfolio: {e}")
+            log(f"Error loading portfolio: {e}", logging.ERROR)
             return tiers
     
     def _parse_targets(self, target_str: str) -> List[Dict]:
@@ -181,7 +407,7 @@ class FFICryptoNewsBot:
         
         return targets
     
-    async def fetch_coin_prices(self, symbols: List[str]) -> Dict[str, float]:
+    async def fetch_coin_prices(self, session: aiohttp.ClientSession, symbols: List[str]) -> Dict[str, float]:
         """Fetch current prices from CoinGecko"""
         symbol_to_id = {
             'BTC': 'bitcoin', 'ETH': 'ethereum', 'DOT': 'polkadot',
@@ -205,20 +431,21 @@ class FFICryptoNewsBot:
             
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={','.join(ids)}&vs_currencies=usd"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        for symbol in symbols:
-                            coin_id = symbol_to_id.get(symbol, symbol.lower())
-                            if coin_id in data and 'usd' in data[coin_id]:
-                                prices[symbol] = data[coin_id]['usd']
+            fetch_start = time.perf_counter()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    self.metrics.observe('price_fetch_seconds', time.perf_counter() - fetch_start)
+                    
+                    for symbol in symbols:
+                        coin_id = symbol_to_id.get(symbol, symbol.lower())
+                        if coin_id in data and 'usd' in data[coin_id]:
+                            prices[symbol] = data[coin_id]['usd']
             
             log(f"Fetched prices for {len(prices)}/{len(symbols)} coins")
-            
+        
         except Exception as e:
-            log(f"Error fetching prices: {e}")
+            log(f"Error fetching prices: {e}", logging.ERROR)
         
         return prices
     
@@ -284,7 +511,7 @@ class FFICryptoNewsBot:
         
         return signals
     
-    async def send_portfolio_update(self, tiers: Dict, prices: Dict[str, float], signals: Dict):
+    async def send_portfolio_update(self, session: aiohttp.ClientSession, tiers: Dict, prices: Dict[str, float], signals: Dict):
         """Send portfolio update to Discord (German) and Telegram (English)"""
         
         # Build German message for Discord
@@ -348,196 +575,192 @@ class FFICryptoNewsBot:
                 message_en += f"• {alert['coin']} ({alert['symbol']}): {alert['message']}\n"
         
         # Send German to Discord
-        for webhook_name, webhook_url in self.discord_webhooks:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    payload = {"content": message_de}
-                    async with session.post(webhook_url, json=payload) as response:
-                        if response.status == 204:
-                            log(f"Portfolio update sent to {webhook_name} (German)")
-                        else:
-                            log(f"Failed to send portfolio update to {webhook_name}: {response.status}")
-            except Exception as e:
-                log(f"Error sending portfolio update to {webhook_name}: {e}")
+        results = await self.fan_out_discord(session, {"content": message_de})
+        for webhook_name, result in results.items():
+            if result['ok']:
+                log(f"Portfolio update sent to {webhook_name} (German)")
+            else:
+                log(f"Failed to send portfolio update to {webhook_name}: {result['error']}", logging.WARNING)
         
         # Send English to Telegram
         try:
-            await self.send_to_telegram(message_en)
+            await self.send_to_telegram(session, message_en)
             log("Portfolio update sent to Telegram (English)")
         except Exception as e:
-            log(f"Error sending portfolio update to Telegram: {e}")
+            log(f"Error sending portfolio update to Telegram: {e}", logging.ERROR)
     
-    def load_processed_articles(self) -> set:
-        """Load previously processed article URLs and last run time."""
+    def load_processed_articles(self) -> DedupStore:
+        """Load last run time and per-feed HTTP state, and open the processed-article index.
+        
+        URLs from the old 'articles' list in processed_articles.json are moved
+        into the index once.
+        """
+        self.feed_state = {}
+        self.last_run_time = None
+        
+        store = DedupStore(
+            os.path.splitext(self.processed_file)[0] + '.jsonl',
+            max_entries=self.config['dedup_max_entries'],
+            max_age_days=self.config['dedup_max_age_days'],
+            compact_every=self.config['dedup_compact_every']
+        )
+        
         try:
             if os.path.exists(self.processed_file):
                 with open(self.processed_file, 'r') as f:
                     data = json.load(f)
                     self.last_run_time = data.get('last_run_time', None)
+                    self.feed_state = data.get('feeds', {})
                     if self.last_run_time:
                         log(f"Last successful run: {self.last_run_time}")
-                    return set(data.get('articles', []))
+                    
+                    legacy_articles = data.get('articles', [])
+                    if legacy_articles:
+                        migrated_at = datetime.fromisoformat(data.get('last_updated', datetime.now().isoformat()))
+                        store.update(legacy_articles, migrated_at.timestamp())
+                        log(f"Migrated {len(legacy_articles)} processed articles to {store.path}")
         except Exception as e:
-            log(f"Could not load processed articles: {e}")
-        self.last_run_time = None
-        return set()
+            log(f"Could not load processed articles: {e}", logging.ERROR)
+        return store
     
     def save_processed_articles(self):
-        """Save processed article URLs and current run time."""
+        """Append newly processed article URLs and save current run time and per-feed HTTP state."""
         try:
-            recent_articles = list(self.processed_articles)[-100:]
+            written = self.processed_articles.flush()
+            self.story_index.flush()
             data = {
-                'articles': recent_articles,
                 'last_updated': datetime.now().isoformat(),
-                'last_run_time': datetime.now().isoformat()
+                'last_run_time': datetime.now().isoformat(),
+                'feeds': self.feed_state
             }
             with open(self.processed_file, 'w') as f:
                 json.dump(data, f, indent=2)
-            log(f"Saved {len(recent_articles)} processed articles")
+            log(f"Saved {written} processed article record(s), {len(self.processed_articles)} tracked")
         except Exception as e:
-            log(f"Could not save processed articles: {e}")
+            log(f"Could not save processed articles: {e}", logging.ERROR)
     
-    def is_crypto_related(self, title: str, description: str = '') -> bool:
+    def scan_keywords(self, title: str, description: str = '') -> Dict[str, set]:
+        """Scan title and description once for every keyword category."""
+        return self.keyword_matcher.scan(f"{title} {description}")
+    
+    def is_crypto_related(self, title: str, description: str = '', hits: Dict[str, set] = None) -> bool:
         """Check if article is cryptocurrency-related."""
-        text = f"{title} {description}".lower()
-        return any(keyword in text for keyword in self.crypto_keywords)
+        if hits is None:
+            hits = self.scan_keywords(title, description)
+        return bool(hits['crypto'])
     
-    def is_recent(self, published_time: str, hours_back: int = None) -> Tuple[bool, str]:
-        """Check if article was published recently. Returns (is_recent, age_description)."""
-        try:
-            if hours_back is None:
-                hours_back = self.config['hours_lookback']
-            
-            # Try multiple date formats
-            pub_time = None
-            for fmt in ['%a, %d %b %Y %H:%M:%S %z', '%a, %d %b %Y %H:%M:%S %Z', 
-                       '%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%dT%H:%M:%SZ']:
-                try:
-                    pub_time = datetime.strptime(published_time, fmt)
-                    if pub_time.tzinfo is None:
-                        pub_time = pub_time.replace(tzinfo=None)
-                    else:
-                        pub_time = pub_time.replace(tzinfo=None)  # Convert to naive for comparison
-                    break
-                except:
-                    continue
-            
-            if pub_time is None:
-                # Fallback to feedparser time parsing
-                try:
-                    pub_time = datetime.fromtimestamp(time.mktime(time.strptime(published_time)))
-                except:
-                    log(f"Could not parse timestamp: {published_time}")
-                    return (False, "unknown age")  # Reject articles with unparseable dates
-            
-            now = datetime.now()
-            age = now - pub_time
-            cutoff_time = now - timedelta(hours=hours_back)
-            
-            # Calculate age description
-            if age.total_seconds() < 3600:
-                age_desc = f"{int(age.total_seconds() / 60)} minutes old"
-            elif age.total_seconds() < 86400:
-                age_desc = f"{int(age.total_seconds() / 3600)} hours old"
-            else:
-                age_desc = f"{int(age.total_seconds() / 86400)} days old"
-            
-            is_recent = pub_time > cutoff_time
-            return (is_recent, age_desc)
-        except Exception as e:
-            log(f"Error checking article age: {e}")
-            return (False, "error parsing date")
+    def is_recent(self, published_ts: Optional[int], hours_back: int = None, now: int = None,
+                  since: int = None) -> Tuple[bool, str]:
+        """Check if article was published recently. Returns (is_recent, age_description).
+        
+        published_ts, now and since are UTC epoch seconds (see feed_dates.entry_timestamp).
+        Recent means newer than since when given, otherwise within hours_back.
+        """
+        if published_ts is None:
+            return (False, "unknown age")  # Reject articles with unparseable dates
+        
+        if hours_back is None:
+            hours_back = self.config['hours_lookback']
+        if now is None:
+            now = int(time.time())
+        if since is None:
+            since = now - hours_back * 3600
+        
+        age_desc = describe_age(max(now - published_ts, 0))
+        return (published_ts > since, age_desc)
+    
+    def fetch_window_start(self, name: str, now: int) -> int:
+        """Epoch seconds after which this feed's entries count as new.
+        
+        The feed's high-water mark (newest entry seen on an earlier run) when
+        known, else the last successful run, else HOURS_LOOKBACK; never further
+        back than MAX_LOOKBACK_HOURS.
+        """
+        since = self.feed_state.get(name, {}).get('high_water')
+        if since is None and self.last_run_time:
+            try:
+                since = int(datetime.fromisoformat(self.last_run_time).timestamp())
+            except ValueError:
+                since = None
+        if since is None:
+            since = now - self.config['hours_lookback'] * 3600
+        return max(since, now - self.config['max_lookback_hours'] * 3600)
     
-    def calculate_market_impact_score(self, title: str, description: str) -> int:
+    def calculate_market_impact_score(self, title: str, description: str, hits: Dict[str, set] = None) -> int:
         """Calculate market impact score (1-5) - Module 8 feature."""
-        text = f"{title} {description}".lower()
+        if hits is None:
+            hits = self.scan_keywords(title, description)
         
-        # High impact keywords (score 5)
-        high_impact = ['sec', 'regulation', 'ban', 'approval', 'etf', 'lawsuit', 
-                       'hack', 'exploit', 'breach', 'shutdown', 'halving', 'merge']
-        
-        # Medium-high impact (score 4)
-        medium_high = ['blackrock', 'fidelity', 'institutional', 'adoption', 
-                       'partnership', 'integration', 'upgrade', 'fork']
-        
-        # Medium impact (score 3)
-        medium = ['binance', 'coinbase', 'exchange', 'trading', 'volume', 
-                  'price', 'market cap', 'whale']
-        
-        if any(keyword in text for keyword in high_impact):
+        if hits['impact_high']:
             return 5
-        elif any(keyword in text for keyword in medium_high):
+        elif hits['impact_medium_high']:
             return 4
-        elif any(keyword in text for keyword in medium):
+        elif hits['impact_medium']:
             return 3
         else:
             return 2
     
-    def calculate_relevance_score(self, title: str, description: str) -> int:
+    def calculate_relevance_score(self, title: str, description: str, hits: Dict[str, set] = None) -> int:
         """Calculate relevance score (1-5) based on coin importance - Module 8 feature."""
-        text = f"{title} {description}".lower()
+        if hits is None:
+            hits = self.scan_keywords(title, description)
         
         # Tier 1: Bitcoin, Ethereum, Market-wide (score 5)
-        if any(word in text for word in ['bitcoin', 'btc', 'ethereum', 'eth', 'crypto market', 'cryptocurrency market']):
+        if hits['relevance_major']:
             return 5
         
         # Tier 2: Major altcoins (score 4)
-        elif any(word in text for word in ['solana', 'cardano', 'polkadot', 'xrp', 'chainlink']):
+        elif hits['relevance_altcoin']:
             return 4
         
         # Tier 3: Popular altcoins (score 3)
-        elif any(word in text for word in ['avalanche', 'polygon', 'matic', 'arbitrum', 'optimism']):
+        elif hits['relevance_popular']:
             return 3
         
         # Default: Other coins (score 2)
         else:
             return 2
     
-    def analyze_sentiment_enhanced(self, title: str, description: str) -> Tuple[int, str, str]:
+    def analyze_sentiment_enhanced(self, title: str, description: str,
+                                   hits: Dict[str, set] = None) -> Tuple[int, str, str]:
         """Enhanced sentiment analysis with numeric score - Module 8 feature."""
-        text = f"{title} {description}".lower()
-        
-        positive_words = ['surge', 'rally', 'bull', 'gain', 'rise', 'up', 'high', 'moon', 
-                         'breakthrough', 'adoption', 'partnership', 'launch', 'upgrade', 
-                         'soar', 'jump', 'spike', 'boom', 'success']
+        if hits is None:
+            hits = self.scan_keywords(title, description)
         
-        negative_words = ['crash', 'dump', 'bear', 'fall', 'drop', 'down', 'low', 'hack',
-                         'ban', 'regulation', 'concern', 'warning', 'risk', 'decline',
-                         'plunge', 'collapse', 'fail', 'scam', 'fraud']
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
+        positive_count = len(hits['positive'])
+        negative_count = len(hits['negative'])
         
         # Calculate sentiment score (-5 to +5)
         sentiment_score = positive_count - negative_count
         sentiment_score = max(-5, min(5, sentiment_score))  # Clamp to range
         
+        sentiment_label, color = self.label_sentiment(sentiment_score)
+        return sentiment_score, sentiment_label, color
+    
+    def label_sentiment(self, sentiment_score: int) -> Tuple[str, str]:
+        """Map a sentiment score to its label and color."""
         if sentiment_score > 0:
-            sentiment_label = 'Bullish'
-            color = 'green'
+            return 'Bullish', 'green'
         elif sentiment_score < 0:
-            sentiment_label = 'Bearish'
-            color = 'red'
+            return 'Bearish', 'red'
         else:
-            sentiment_label = 'Neutral'
-            color = 'yellow'
-        
-        return sentiment_score, sentiment_label, color
+            return 'Neutral', 'yellow'
     
-    def calculate_time_impact_score(self, title: str, description: str) -> int:
+    def calculate_time_impact_score(self, title: str, description: str, hits: Dict[str, set] = None) -> int:
         """Calculate time impact/urgency score (1-5) - Module 8 feature."""
-        text = f"{title} {description}".lower()
+        if hits is None:
+            hits = self.scan_keywords(title, description)
         
         # Immediate urgency (score 5)
-        if any(word in text for word in ['breaking', 'just in', 'alert', 'emergency', 'now']):
+        if hits['time_immediate']:
             return 5
         
         # Short-term (score 4)
-        elif any(word in text for word in ['today', 'announced', 'hours ago', 'this morning']):
+        elif hits['time_short']:
             return 4
         
         # Medium-term (score 3)
-        elif any(word in text for word in ['this week', 'upcoming', 'soon', 'scheduled']):
+        elif hits['time_medium']:
             return 3
         
         # Default (score 2)
@@ -549,11 +772,14 @@ class FFICryptoNewsBot:
         title = article['title']
         description = article['description']
         
-        # Individual scores
-        market_impact = self.calculate_market_impact_score(title, description)
-        relevance = self.calculate_relevance_score(title, description)
-        sentiment_score, sentiment_label, sentiment_color = self.analyze_sentiment_enhanced(title, description)
-        time_impact = self.calculate_time_impact_score(title, description)
+        # Individual scores, all derived from a single keyword scan (the filter's, if kept)
+        hits = article.get('hits')
+        if hits is None:
+            hits = self.scan_keywords(title, description)
+        market_impact = self.calculate_market_impact_score(title, description, hits)
+        relevance = self.calculate_relevance_score(title, description, hits)
+        sentiment_score, sentiment_label, sentiment_color = self.analyze_sentiment_enhanced(title, description, hits)
+        time_impact = self.calculate_time_impact_score(title, description, hits)
         
         # Weighted total score (0-5 scale)
         total_score = (
@@ -564,6 +790,12 @@ class FFICryptoNewsBot:
             time_impact * 0.15
         )
         
+        return self.build_significance(credibility, market_impact, relevance, sentiment_score,
+                                       sentiment_label, sentiment_color, time_impact, total_score)
+    
+    def build_significance(self, credibility: int, market_impact: int, relevance: int, sentiment_score: int,
+                           sentiment_label: str, sentiment_color: str, time_impact: int, total_score: float) -> Dict:
+        """Assemble the significance fields of an article from its component scores."""
         # Classification
         if total_score >= 3.5:
             classification = 'High Impact'
@@ -588,128 +820,613 @@ class FFICryptoNewsBot:
             'classification_emoji': classification_emoji
         }
     
+    def score_batch(self, articles: List[Dict]) -> Tuple[List[Dict], int]:
+        """Score a whole list of articles at once and select the top max_articles.
+        
+        Builds a keyword-hit matrix (one row per article, one column per scoring
+        category) from the hits filter_crypto kept, and derives every component score and total_score with NumPy
+        array operations. Articles below min_significance_score are dropped and
+        the top N are picked with argpartition instead of a full sort.
+        
+        Only the selected articles get their significance fields filled in.
+        Returns (selected articles highest first, number above the minimum score).
+        """
+        if not articles:
+            return [], 0
+        
+        if np is None:
+            for article in articles:
+                article.update(self.calculate_significance_score(article, article['credibility']))
+            ranked = self.rank_articles(articles)
+            return ranked[:self.config['max_articles']], len(ranked)
+        
+        # Hits kept by filter_crypto; articles built elsewhere are scanned here
+        rows = []
+        for a in articles:
+            hits = a.get('hits')
+            if hits is None:
+                hits = self.scan_keywords(a['title'], a['description'])
+            rows.append([len(hits[category]) for category in SCORE_CATEGORIES])
+        matrix = np.array(rows, dtype=np.int16)
+        column = {category: matrix[:, index] for index, category in enumerate(SCORE_CATEGORIES)}
+        
+        def tiered(high: str, medium: str, low: str) -> 'np.ndarray':
+            return np.select([column[high] > 0, column[medium] > 0, column[low] > 0], [5, 4, 3], default=2)
+        
+        credibility = np.array([a['credibility'] for a in articles], dtype=np.float64)
+        market_impact = tiered('impact_high', 'impact_medium_high', 'impact_medium')
+        relevance = tiered('relevance_major', 'relevance_altcoin', 'relevance_popular')
+        sentiment = np.clip(column['positive'].astype(np.int64) - column['negative'], -5, 5)
+        time_impact = tiered('time_immediate', 'time_short', 'time_medium')
+        
+        # Same weights and evaluation order as calculate_significance_score
+        total = (
+            credibility * 0.20 +
+            market_impact * 0.30 +
+            relevance * 0.20 +
+            np.abs(sentiment) * 0.15 +
+            time_impact * 0.15
+        )
+        rounded = np.array([round(score, 1) for score in total.tolist()])
+        
+        eligible = np.flatnonzero(rounded >= self.config['min_significance_score'])
+        top_n = min(self.config['max_articles'], len(eligible))
+        if top_n == 0:
+            return [], len(eligible)
+        
+        if top_n < len(eligible):
+            # kth-best score via argpartition; ties at the cut go to the earliest article,
+            # exactly like the stable full sort this replaces
+            scores = rounded[eligible]
+            cutoff = scores[np.argpartition(-scores, top_n - 1)[top_n - 1]]
+            above = eligible[scores > cutoff]
+            at_cutoff = eligible[scores == cutoff][:top_n - len(above)]
+            selected = np.concatenate([above, at_cutoff])
+        else:
+            selected = eligible
+        
+        # Highest score first, original order among equal scores
+        selected = selected[np.lexsort((selected, -rounded[selected]))]
+        
+        results = []
+        for index in selected.tolist():
+            sentiment_score = int(sentiment[index])
+            sentiment_label, sentiment_color = self.label_sentiment(sentiment_score)
+            article = articles[index]
+            article.update(self.build_significance(
+                article['credibility'], int(market_impact[index]), int(relevance[index]), sentiment_score,
+                sentiment_label, sentiment_color, int(time_impact[index]), float(total[index])
+            ))
+            results.append(article)
+        
+        return results, len(eligible)
+    
     async def fetch_rss_feed(self, session: aiohttp.ClientSession, name: str, feed_data: Dict) -> List[Dict]:
-        """Fetch and parse RSS feed with credibility scoring."""
+        """Fetch RSS feed and hand parsing and filtering to the parse worker pool.
+        
+        With FEED_PARSER=stream the body is parsed chunk by chunk as it arrives
+        (see stream_feed) instead of being buffered for feedparser.
+        """
         try:
             url = feed_data['url']
             credibility = feed_data['credibility']
+            fetch_start = time.perf_counter()
+            
+            # Conditional GET: let the server answer 304 when nothing changed
+            state = self.feed_state.setdefault(name, {})
+            headers = {}
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+            
+            loop = asyncio.get_running_loop()
+            now = int(time.time())
+            since = self.fetch_window_start(name, now)
+            streamed = None
             
             log(f"Fetching RSS feed from {name} (credibility: {credibility}/5)")
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-                    
-                    articles = []
-                    for entry in feed.entries:
-                        # Check if crypto-related first
-                        if not self.is_crypto_related(entry.title, getattr(entry, 'summary', '')):
-                            continue
-                        
-                        # Check recency with age info
-                        published = getattr(entry, 'published', '')
-                        is_recent, age_desc = self.is_recent(published)
-                        
-                        # Skip if already processed
-                        if entry.link in self.processed_articles:
-                            continue
-                        
-                        # Skip if not recent
-                        if not is_recent:
-                            log(f"Skipping old article ({age_desc}): {entry.title[:50]}...")
-                            continue
-                        
-                        # Check if article is ABOUT old events (even if recently published)
-                        title_lower = entry.title.lower()
-                        summary_lower = getattr(entry, 'summary', '').lower()
-                        old_event_keywords = [
-                            # Past time references
-                            'yesterday', 'gestern', 'einen tag nach', 'one day after',
-                            'last week', 'letzte woche', 'days ago', 'vor tagen',
-                            'last month', 'letzten monat', 'weeks ago', 'vor wochen',
-                            # Daily summaries and newsletters
-                            'tagesnachrichten', 'daily news', 'the daily', 'newsletter',
-                            'daily roundup', 'roundup', 'zusammenfassung', 'wochentagnachmittagen',
-                            'weekly roundup', 'wochenrückblick', 'recap', 'rückblick'
-                        ]
-                        
-                        is_about_old_event = any(keyword in title_lower or keyword in summary_lower 
-                                                for keyword in old_event_keywords)
-                        
-                        if is_about_old_event:
-                            log(f"Skipping article about past events: {entry.title[:50]}...")
-                            continue
-                        
-                        log(f"Found fresh article ({age_desc}): {entry.title[:50]}...")
-                        
-                        article = {
-                            'title': entry.title,
-                            'link': entry.link,
-                            'description': getattr(entry, 'summary', '')[:300],
-                            'source': name,
-                            'published': published,
-                            'credibility': credibility,
-                            'age': age_desc
+            with self.profiler.span('fetch', name):
+                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status == 304:
+                        self.feed_stats[name] = {
+                            'status': 304,
+                            'bytes': 0,
+                            'parse_seconds': 0.0,
+                            'skipped_bytes': state.get('content_length', 0),
+                            'skipped_parse_seconds': state.get('parse_seconds', 0.0),
+                            'wall_seconds': time.perf_counter() - fetch_start
                         }
-                        
-                        # Calculate significance scores
-                        scores = self.calculate_significance_score(article, credibility)
-                        article.update(scores)
-                        
-                        articles.append(article)
+                        self.feed_scheduler.observe(state, [], 0)
+                        self.count_feed_fetch(name, 304, fetch_start)
+                        log(f"{name} not modified since last run, skipping parse")
+                        return []
                     
-                    log(f"Found {len(articles)} new crypto articles from {name}")
-                    return articles
-                else:
-                    log(f"Failed to fetch {name}: HTTP {response.status}")
+                    if response.status == 200:
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        if self.config['feed_parser'] == 'stream' and not state.get('stream_failed'):
+                            streamed = await self.stream_feed(response, name, credibility, now, since,
+                                                              state.get('date_ordered', False))
+                        else:
+                            content = await response.read()
+                        self.count_feed_fetch(name, 200, fetch_start)
+                    else:
+                        self.feed_stats[name] = {'status': response.status, 'bytes': 0, 'parse_seconds': 0.0,
+                                                 'skipped_bytes': 0, 'skipped_parse_seconds': 0.0,
+                                                 'wall_seconds': time.perf_counter() - fetch_start}
+                        self.feed_scheduler.observe(state, [], 0)
+                        self.count_feed_fetch(name, response.status, fetch_start)
+                        log(f"Failed to fetch {name}: HTTP {response.status}", logging.WARNING)
+                        return []
+            
+            if streamed is not None:
+                articles, parse_seconds, scan, size = streamed
+                if scan['error'] is not None:
+                    # Not cached under this ETag, so the next poll re-reads it with feedparser
+                    log(f"{name}: streaming parse failed ({scan['error']}), "
+                        f"using feedparser from the next poll", logging.WARNING)
+                    state['stream_failed'] = True
+                    etag = last_modified = None
+            else:
+                # Parsing and per-entry scoring are CPU-bound; keep them off the event loop
+                articles, parse_seconds, scan = await loop.run_in_executor(
+                    self.parse_executor, self.parse_feed, content, name, credibility,
+                    now, since, state.get('date_ordered', False)
+                )
+                size = len(content)
+            wall_seconds = time.perf_counter() - fetch_start
+            self.profiler.record('parse', parse_seconds, name)
+            
+            if scan['stopped_at'] is not None and streamed is not None:
+                log(f"{name}: stopped reading at entry {scan['stopped_at'] + 1} after {size / 1024:.0f} KB, "
+                    f"older than the high-water mark")
+            elif scan['stopped_at'] is not None:
+                log(f"{name}: stopped at entry {scan['stopped_at'] + 1}/{scan['entries']}, "
+                    f"older than the high-water mark")
+            self.metrics.inc('entries_seen', scan['entries'] if scan['stopped_at'] is None else scan['stopped_at'],
+                             feed=name)
+            for stage, stats in scan['stages'].items():
+                self.profiler.record('filter', stats['seconds'], stage)
+                self.metrics.inc('entries_filtered', stats['rejected'], stage=stage)
+                totals = self.filter_stats[stage]
+                for key, value in stats.items():
+                    totals[key] += value
+            
+            state.update({
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_length': size,
+                'parse_seconds': round(parse_seconds, 4),
+                'date_ordered': scan['date_ordered']
+            })
+            if scan['newest'] is not None:
+                state['high_water'] = max(scan['newest'], state.get('high_water', 0))
+            self.feed_scheduler.observe(state, scan['timestamps'], scan['fresh'])
+            self.feed_stats[name] = {
+                'status': 200,
+                'bytes': size,
+                'parse_seconds': parse_seconds,
+                'skipped_bytes': 0,
+                'skipped_parse_seconds': 0.0,
+                'wall_seconds': wall_seconds
+            }
+            
+            # Per-entry skips are DEBUG lines; one aggregated line per feed at INFO
+            skipped = {stage: stats['rejected'] for stage, stats in scan['stages'].items() if stats['rejected']}
+            log(f"Found {len(articles)} new crypto articles from {name} in {wall_seconds * 1000:.0f} ms"
+                + (f" (skipped: {', '.join(f'{count} {stage}' for stage, count in skipped.items())})" if skipped else ""),
+                feed=name, articles=len(articles), skipped=skipped, ms=round(wall_seconds * 1000))
+            return articles
         except Exception as e:
-            log(f"Error fetching {name}: {e}")
+            self.metrics.inc('feed_fetches', feed=name, status='error')
+            log(f"Error fetching {name}: {e}", logging.ERROR)
         return []
     
-    async def translate_to_german(self, text: str) -> str:
-        """Translate text to German using OpenAI."""
+    def count_feed_fetch(self, name: str, status: int, fetch_start: float):
+        self.metrics.inc('feed_fetches', feed=name, status=str(status))
+        self.metrics.observe('feed_fetch_seconds', time.perf_counter() - fetch_start, feed=name)
+    
+    def parse_feed(self, content: bytes, name: str, credibility: int, now: int = None,
+                   since: int = None, date_ordered: bool = False) -> Tuple[List[Dict], float, Dict]:
+        """Parse a feed body and filter its new entries. Runs in the parse worker pool.
+        
+        Entries at or before since are not new. If the feed was newest-first on
+        its last full pass (date_ordered), iteration stops at the first such
+        entry as long as the order still holds.
+        
+        Returns the unscored candidate articles, the time spent parsing and
+        filtering, and a scan summary: per-stage filter counters (merged into
+        filter_stats on the event loop), the entry timestamps seen and how many
+        were new (for the feed scheduler), the newest one, whether the feed is
+        date-ordered and where iteration stopped. Scoring happens
+        for all feeds at once in score_batch.
+        """
+        parse_start = time.perf_counter()
+        feed = feedparser.parse(content)
+        
+        scan = self.start_scan()
+        self.scan_entries(scan, feed.entries, name, credibility, now, since, date_ordered)
+        articles = self.finish_scan(scan, date_ordered)
+        scan['entries'] = len(feed.entries)
+        return articles, time.perf_counter() - parse_start, scan
+    
+    async def stream_feed(self, response: aiohttp.ClientResponse, name: str, credibility: int,
+                          now: int, since: int, date_ordered: bool) -> Tuple[List[Dict], float, Dict, int]:
+        """Parse and filter a feed body chunk by chunk while it downloads.
+        
+        Each chunk goes through the pull parser and the filter chain in the parse
+        worker pool, and only the current entry is ever held in memory. Reading
+        stops (and the connection is dropped) at the first entry older than the
+        high-water mark of a date-ordered feed.
+        
+        Returns what parse_feed returns plus the number of bytes read. On
+        malformed XML, scan['error'] is set and the entries read so far are
+        returned; the high-water mark is not advanced past a partial read.
+        """
+        loop = asyncio.get_running_loop()
+        parser = StreamingFeedParser()
+        scan = self.start_scan()
+        parse_seconds = 0.0
+        size = 0
+        
+        def parse_chunk(chunk: Optional[bytes]) -> Tuple[bool, float]:
+            chunk_start = time.perf_counter()
+            entries = parser.feed(chunk) if chunk is not None else parser.close()
+            more = self.scan_entries(scan, entries, name, credibility, now, since, date_ordered)
+            return more, time.perf_counter() - chunk_start
+        
         try:
-            if not self.config['openai_api_key']:
-                return "[Translation unavailable]"
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                size += len(chunk)
+                more, seconds = await loop.run_in_executor(self.parse_executor, parse_chunk, chunk)
+                parse_seconds += seconds
+                if not more:
+                    break
+            else:
+                _, seconds = await loop.run_in_executor(self.parse_executor, parse_chunk, None)
+                parse_seconds += seconds
+        except ParseError as e:
+            scan['error'] = str(e)
+        
+        articles = self.finish_scan(scan, date_ordered)
+        if scan['error'] is not None:
+            scan['newest'] = None
+        return articles, parse_seconds, scan, size
+    
+    def start_scan(self) -> Dict:
+        """Empty scan state for scan_entries."""
+        return {
+            'stages': {},
+            'articles': [],
+            'newest': None,
+            'timestamps': [],
+            'fresh': 0,
+            'previous_ts': None,
+            'descending': True,
+            'entries': 0,
+            'stopped_at': None,
+            'error': None
+        }
+    
+    def scan_entries(self, scan: Dict, entries: Iterable, name: str, credibility: int, now: int = None,
+                     since: int = None, date_ordered: bool = False) -> bool:
+        """Filter entries into scan['articles'], tracking timestamps and feed order.
+        
+        Can be called repeatedly for consecutive runs of entries of one feed.
+        Returns False once iteration stopped at the high-water mark.
+        """
+        if now is None:
+            now = int(time.time())
+        for entry in entries:
+            index = scan['entries']
+            scan['entries'] += 1
+            published_ts = entry_timestamp(entry)
+            if published_ts is not None:
+                previous_ts = scan['previous_ts']
+                scan['descending'] = scan['descending'] and (previous_ts is None or published_ts <= previous_ts)
+                scan['previous_ts'] = published_ts
+                # Future-dated entries must not push the mark past the present
+                scan['newest'] = max(scan['newest'] or 0, min(published_ts, now))
+                scan['timestamps'].append(published_ts)
+                if since is None or published_ts > since:
+                    scan['fresh'] += 1
+                elif date_ordered and scan['descending']:
+                    scan['stopped_at'] = index
+                    return False
             
-            url = "https://api.openai.com/v1/chat/completions"
+            article = self.filter_entry(entry, name, credibility, now, scan['stages'], since, published_ts)
+            if article is not None:
+                scan['articles'].append(article)
+        return True
+    
+    def finish_scan(self, scan: Dict, date_ordered: bool) -> List[Dict]:
+        """Settle the feed's date order and take the articles out of the scan summary."""
+        descending = scan.pop('descending')
+        scan.pop('previous_ts')
+        scan['date_ordered'] = date_ordered if scan['stopped_at'] is not None else descending
+        return scan.pop('articles')
+    
+    def filter_entry(self, entry, name: str, credibility: int, now: int = None,
+                     stage_stats: Dict = None, since: int = None, published_ts: int = None) -> Optional[Dict]:
+        """Run the entry through filter_stages in order, stopping at the first reject.
+        
+        Returns an unscored article dict, or None if rejected. When stage_stats
+        is given, each stage's entries, rejects and time are counted in it.
+        since is the feed's fetch window start (default: HOURS_LOOKBACK);
+        published_ts is the entry's timestamp if the caller already parsed it.
+        """
+        candidate = {'now': int(time.time()) if now is None else now, 'since': since,
+                     'published_ts': published_ts}
+        for stage, check in self.filter_stages:
+            stage_start = time.perf_counter()
+            passed = check(entry, candidate)
+            if stage_stats is not None:
+                stats = stage_stats.setdefault(stage, {'entries': 0, 'rejected': 0, 'seconds': 0.0})
+                stats['entries'] += 1
+                stats['rejected'] += not passed
+                stats['seconds'] += time.perf_counter() - stage_start
+            if not passed:
+                return None
+        
+        log(f"Found fresh article ({candidate['age']}): {entry.title[:50]}...", logging.DEBUG)
+        
+        return {
+            'title': entry.title,
+            'link': entry.link,
+            'description': candidate['description'],
+            'source': name,
+            'published': getattr(entry, 'published', ''),
+            'published_ts': candidate['published_ts'],
+            'credibility': credibility,
+            'age': candidate['age'],
+            'sketch': candidate['sketch'],
+            'hits': candidate['hits']
+        }
+    
+    def filter_processed(self, entry, candidate: Dict) -> bool:
+        """Skip links already delivered (or folded into a delivered story)."""
+        return entry.link not in self.processed_articles
+    
+    def filter_recency(self, entry, candidate: Dict) -> bool:
+        """Skip entries with unparseable dates or not newer than the fetch window start."""
+        published_ts = candidate['published_ts']
+        if published_ts is None:
+            published_ts = candidate['published_ts'] = entry_timestamp(entry)
+        is_recent, age_desc = self.is_recent(published_ts, now=candidate['now'], since=candidate['since'])
+        candidate['age'] = age_desc
+        
+        if published_ts is None:
+            log(f"Could not parse timestamp: {getattr(entry, 'published', '')}", logging.DEBUG)
+            return False
+        if not is_recent:
+            log(f"Skipping old article ({age_desc}): {entry.title[:50]}...", logging.DEBUG)
+            return False
+        return True
+    
+    def filter_crypto(self, entry, candidate: Dict) -> bool:
+        """Skip entries without crypto keywords.
+        
+        Scans the same title and 300-character description that scoring
+        reads, so the hits are kept on the article and not scanned again.
+        """
+        candidate['description'] = getattr(entry, 'summary', '')[:300]
+        candidate['hits'] = self.scan_keywords(entry.title, candidate['description'])
+        return self.is_crypto_related(entry.title, hits=candidate['hits'])
+    
+    def filter_old_event(self, entry, candidate: Dict) -> bool:
+        """Skip articles ABOUT old events, even if recently published."""
+        if candidate['hits']['old_event']:
+            log(f"Skipping article about past events: {entry.title[:50]}...", logging.DEBUG)
+            return False
+        return True
+    
+    def filter_delivered(self, entry, candidate: Dict) -> bool:
+        """Skip stories delivered before under another URL (headline sketch index)."""
+        candidate['sketch'] = title_sketch(entry.title)
+        return candidate['sketch'] not in self.story_index
+    
+    def report_feed_stats(self):
+        """Log per-source transfer and parse costs, including what conditional GETs saved."""
+        saved_bytes = 0
+        saved_seconds = 0.0
+        for name, stats in self.feed_stats.items():
+            if stats['status'] == 304:
+                log(f"  {name}: HTTP 304, skipped {stats['skipped_bytes']} bytes "
+                    f"and {stats['skipped_parse_seconds'] * 1000:.1f} ms parse, "
+                    f"{stats['wall_seconds'] * 1000:.0f} ms total")
+            else:
+                log(f"  {name}: HTTP {stats['status']}, {stats['bytes']} bytes, "
+                    f"{stats['parse_seconds'] * 1000:.1f} ms parse, {stats['wall_seconds'] * 1000:.0f} ms total")
+            saved_bytes += stats['skipped_bytes']
+            saved_seconds += stats['skipped_parse_seconds']
+        log(f"Conditional GET saved {saved_bytes} bytes and {saved_seconds * 1000:.1f} ms parse this run")
+    
+    def report_filter_stats(self):
+        """Log how many entries each filter stage saw and dropped, and its time."""
+        for stage, stats in self.filter_stats.items():
+            log(f"  {stage}: rejected {stats['rejected']}/{stats['entries']} entries "
+                f"in {stats['seconds'] * 1000:.1f} ms")
+    
+    async def request_chat_completion(self, session: aiohttp.ClientSession, system_prompt: str,
+                                      user_content: str, max_tokens: int, timeout: int = 20) -> Optional[str]:
+        """Send one chat-completion request to OpenAI. Returns the reply text or None on HTTP errors."""
+        url = "https://api.openai.com/v1/chat/completions"
+        
+        headers = {
+            "Authorization": f"Bearer {self.config['openai_api_key']}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": TRANSLATION_MODEL,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens
+        }
+        
+        async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 200:
+                result = await response.json()
+                usage = result.get('usage') or {}
+                for kind in ('prompt', 'completion'):
+                    self.metrics.inc('openai_tokens', usage.get(f'{kind}_tokens', 0), kind=kind)
+                return result['choices'][0]['message']['content'].strip()
+            else:
+                log(f"OpenAI translation failed: HTTP {response.status}", logging.WARNING)
+                return None
+    
+    async def translate_to_german(self, session: aiohttp.ClientSession, text: str) -> str:
+        """Translate text to German using OpenAI, serving repeats from the translation cache."""
+        try:
+            cached = self.translation_cache.get(text, TRANSLATION_MODEL, TRANSLATION_SYSTEM_PROMPT)
+            self.metrics.inc('translation_cache_lookups', result='miss' if cached is None else 'hit')
+            if cached is not None:
+                return cached
             
-            headers = {
-                "Authorization": f"Bearer {self.config['openai_api_key']}",
-                "Content-Type": "application/json"
-            }
+            if not self.config['openai_api_key']:
+                return "[Translation unavailable]"
             
-            payload = {
-                "model": "gpt-4o-mini",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator. Translate the following text to German. Keep technical terms and proper nouns in their original form when appropriate. Provide only the German translation."
-                    },
-                    {
-                        "role": "user",
-                        "content": text
-                    }
-                ],
-                "temperature": 0.3,
-                "max_tokens": 500
-            }
+            with self.profiler.span('translate', 'single'):
+                german_text = await self.request_chat_completion(session, TRANSLATION_SYSTEM_PROMPT, text, 500)
+            if german_text is None:
+                return "[Translation failed]"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=20)) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        german_text = result['choices'][0]['message']['content'].strip()
-                        log(f"Translated: {text[:30]}... -> {german_text[:30]}...")
-                        return german_text
-                    else:
-                        error_text = await response.text()
-                        log(f"OpenAI translation failed: HTTP {response.status}")
-                        return "[Translation failed]"
+            self.translation_cache.put(text, TRANSLATION_MODEL, TRANSLATION_SYSTEM_PROMPT, german_text)
+            log(f"Translated: {text[:30]}... -> {german_text[:30]}...")
+            return german_text
         except Exception as e:
-            log(f"Translation error: {e}")
+            log(f"Translation error: {e}", logging.ERROR)
             return "[Translation error]"
     
+    def chunk_for_translation(self, texts: List[str]) -> List[List[int]]:
+        """Group text indices into chunks that stay within the batch token budget."""
+        budget = self.config['translation_batch_token_budget']
+        chunks = []
+        current = []
+        current_tokens = 0
+        
+        for index, text in enumerate(texts):
+            # Rough estimate: ~4 characters per token plus JSON overhead per item
+            tokens = len(text) // 4 + 10
+            if current and current_tokens + tokens > budget:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(index)
+            current_tokens += tokens
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def parse_batch_translation(self, reply: Optional[str], expected_ids: List[int]) -> Dict[int, str]:
+        """Map a batch reply back to item ids, dropping entries that are missing or malformed."""
+        if not reply:
+            return {}
+        
+        # Tolerate a Markdown code fence around the JSON array
+        reply = reply.strip()
+        if reply.startswith('```'):
+            reply = reply.strip('`')
+            if reply.startswith('json'):
+                reply = reply[4:]
+        
+        try:
+            items = json.loads(reply)
+        except ValueError:
+            return {}
+        
+        if not isinstance(items, list):
+            return {}
+        
+        translated = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            item_id = item.get('id')
+            text = item.get('text')
+            if item_id in expected_ids and isinstance(text, str) and text.strip():
+                translated[item_id] = text.strip()
+        return translated
+    
+    async def translate_batch(self, session: aiohttp.ClientSession, texts: List[str]) -> List[str]:
+        """Translate many texts to German with as few OpenAI requests as possible.
+        
+        All texts go out as one JSON array of {"id", "text"} objects, split into
+        several requests only when TRANSLATION_BATCH_TOKEN_BUDGET is exceeded.
+        Entries that cannot be parsed from the reply fall back to translate_to_german.
+        """
+        if not texts:
+            return []
+        
+        # Identical strings are translated once, cached ones not at all
+        unique_texts = list(dict.fromkeys(texts))
+        results = {}
+        for index, text in enumerate(unique_texts):
+            cached = self.translation_cache.get(text, TRANSLATION_MODEL, BATCH_TRANSLATION_SYSTEM_PROMPT)
+            self.metrics.inc('translation_cache_lookups', result='miss' if cached is None else 'hit')
+            if cached is not None:
+                results[index] = cached
+        
+        cache_hits = len(results)
+        pending = [index for index in range(len(unique_texts)) if index not in results]
+        unavailable = 0
+        if pending and not self.config['openai_api_key']:
+            results.update((index, "[Translation unavailable]") for index in pending)
+            unavailable = len(pending)
+            pending = []
+        chunk_slots = asyncio.Semaphore(self.config['translation_concurrency'])
+        
+        async def translate_chunk(indices: List[int]):
+            request_items = [{'id': index, 'text': unique_texts[index]} for index in indices]
+            reply = None
+            
+            async with chunk_slots:
+                try:
+                    estimated_tokens = sum(len(unique_texts[index]) // 4 + 10 for index in indices)
+                    with self.profiler.span('translate', 'batch'):
+                        reply = await self.request_chat_completion(
+                            session,
+                            BATCH_TRANSLATION_SYSTEM_PROMPT,
+                            json.dumps(request_items, ensure_ascii=False),
+                            min(16000, estimated_tokens * 2 + 100),
+                            timeout=60
+                        )
+                except Exception as e:
+                    log(f"Batch translation error: {e}", logging.ERROR)
+            
+            translated = self.parse_batch_translation(reply, indices)
+            results.update(translated)
+            for index, german in translated.items():
+                self.translation_cache.put(unique_texts[index], TRANSLATION_MODEL, BATCH_TRANSLATION_SYSTEM_PROMPT, german)
+            
+            missing = [index for index in indices if index not in translated]
+            if missing:
+                log(f"Batch translation fallback for {len(missing)}/{len(indices)} item(s)", logging.WARNING)
+                fallbacks = await asyncio.gather(*[
+                    self.translate_to_german(session, unique_texts[index]) for index in missing
+                ])
+                results.update(zip(missing, fallbacks))
+        
+        chunks = [[pending[position] for position in chunk]
+                  for chunk in self.chunk_for_translation([unique_texts[index] for index in pending])]
+        await asyncio.gather(*[translate_chunk(chunk) for chunk in chunks])
+        log(f"Translated {len(pending)}/{len(unique_texts)} unique text(s) in {len(chunks)} batch request(s), "
+            f"{cache_hits} from cache" + (f", {unavailable} untranslated (no OpenAI key)" if unavailable else ""))
+        
+        by_text = {unique_texts[index]: german for index, german in results.items()}
+        return [by_text[text] for text in texts]
+    
     def format_article_for_telegram(self, article: Dict, german_title: str = None, german_desc: str = None) -> str:
         """Format article for Telegram in ENGLISH with Module 8 significance indicators."""
         stars = '⭐' * article['credibility']
@@ -729,7 +1446,10 @@ class FFICryptoNewsBot:
         
         message += f"{article['description']}\n\n"
         
-        message += f"Source: {article['source']} | [Read more]({article['link']})"
+        message += f"Source: {article['source']}"
+        if article.get('also_reported_by'):
+            message += f" | Also reported by: {', '.join(article['also_reported_by'])}"
+        message += f" | [Read more]({article['link']})"
         
         return message
     
@@ -770,6 +1490,8 @@ class FFICryptoNewsBot:
         
         description += f"**Klassifizierung:** {classification_de.title()}\n"
         description += f"**Quelle:** {article['source']}\n"
+        if article.get('also_reported_by'):
+            description += f"**Auch berichtet von:** {', '.join(article['also_reported_by'])}\n"
         description += f"**Stimmung:** {sentiment_de}"
         
         embed = {
@@ -786,97 +1508,350 @@ class FFICryptoNewsBot:
         
         return embed
     
-    async def send_to_telegram(self, message: str):
+    def telegram_configured(self) -> bool:
+        return bool(self.config['telegram_token'] and self.config['telegram_chat_id'])
+    
+    async def post_telegram(self, session: aiohttp.ClientSession, message: str) -> int:
+        """Post one message to the Telegram chat within its rate limit; returns the HTTP status."""
+        url = f"https://api.telegram.org/bot{self.config['telegram_token']}/sendMessage"
+        payload = {
+            'chat_id': self.config['telegram_chat_id'],
+            'text': message,
+            'parse_mode': 'Markdown',
+            'disable_web_page_preview': False
+        }
+        status = await self.telegram_limiter.post(session, self.config['telegram_chat_id'], url, payload)
+        self.metrics.inc('delivery_responses', destination='telegram', status=str(status))
+        return status
+    
+    async def send_to_telegram(self, session: aiohttp.ClientSession, message: str):
         """Send message to Telegram."""
-        if not self.config['telegram_token'] or not self.config['telegram_chat_id']:
-            log("Telegram not configured")
+        if not self.telegram_configured():
+            log("Telegram not configured", logging.WARNING)
             return
         
         try:
-            url = f"https://api.telegram.org/bot{self.config['telegram_token']}/sendMessage"
-            payload = {
-                'chat_id': self.config['telegram_chat_id'],
-                'text': message,
-                'parse_mode': 'Markdown',
-                'disable_web_page_preview': False
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        log("Sent to Telegram: " + message.split('\n')[0][:50] + "...")
-                    else:
-                        log(f"Telegram failed: HTTP {response.status}")
+            with self.profiler.span('deliver', 'telegram'):
+                status = await self.post_telegram(session, message)
+            if status == 200:
+                log("Sent to Telegram: " + message.split('\n')[0][:50] + "...")
+            else:
+                log(f"Telegram failed: HTTP {status}", logging.WARNING)
         except Exception as e:
-            log(f"Telegram error: {e}")
+            log(f"Telegram error: {e}", logging.ERROR)
     
-    async def send_to_all_discord_webhooks(self, embed_data: Dict):
-        """Send embed to all configured Discord webhooks."""
-        if not self.discord_webhooks:
-            log("No Discord webhooks configured")
-            return
-        
-        title = embed_data['embeds'][0]['title'][:50]
-        
-        for webhook_name, webhook_url in self.discord_webhooks:
+    async def post_discord(self, session: aiohttp.ClientSession, webhook_url: str, payload: Dict) -> int:
+        """Post to one webhook within its rate limit and DISCORD_TARGET_TIMEOUT; returns the HTTP status."""
+        status = await asyncio.wait_for(
+            self.discord_limiter.post(session, webhook_url, webhook_url, payload),
+            timeout=self.config['discord_target_timeout']
+        )
+        self.metrics.inc('delivery_responses', destination=self.destination_name(webhook_url), status=str(status))
+        return status
+    
+    async def fan_out_discord(self, session: aiohttp.ClientSession, payload: Dict) -> Dict[str, Dict]:
+        """Post one payload to every Discord webhook concurrently.
+        
+        Each target has its own DISCORD_TARGET_TIMEOUT (rate-limit waits
+        included), and a failing or slow server does not hold up the others.
+        Returns {webhook_name: {'ok', 'status', 'error', 'seconds'}}.
+        """
+        async def post(webhook_name: str, webhook_url: str) -> Dict:
+            start = time.perf_counter()
+            result = {'ok': False, 'status': None, 'error': None}
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        webhook_url,
-                        json=embed_data,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        if response.status in [200, 204]:
-                            log(f"Sent to {webhook_name}: {title}...")
-                        else:
-                            log(f"{webhook_name} failed: HTTP {response.status}")
+                with self.profiler.span('deliver', f"discord:{webhook_name}"):
+                    result['status'] = await self.post_discord(session, webhook_url, payload)
+                result['ok'] = result['status'] in [200, 204]
+                if not result['ok']:
+                    result['error'] = f"HTTP {result['status']}"
+            except asyncio.TimeoutError:
+                result['error'] = f"timed out after {self.config['discord_target_timeout']:.0f}s"
             except Exception as e:
-                log(f"{webhook_name} error: {e}")
-            
-            await asyncio.sleep(0.3)
+                result['error'] = str(e) or type(e).__name__
+            result['seconds'] = time.perf_counter() - start
+            return result
+        
+        results = await asyncio.gather(*[post(webhook_name, webhook_url)
+                                         for webhook_name, webhook_url in self.discord_webhooks])
+        return {webhook_name: result for (webhook_name, _), result in zip(self.discord_webhooks, results)}
     
-    async def process_articles(self, articles: List[Dict]):
-        """Process articles with German translation and send to all platforms."""
-        if not articles:
+    def embed_length(self, embed: Dict) -> int:
+        """Characters Discord counts toward the 6000 per-message limit."""
+        length = len(embed.get('title', '')) + len(embed.get('description', ''))
+        length += len(embed.get('footer', {}).get('text', '')) + len(embed.get('author', {}).get('name', ''))
+        length += sum(len(field.get('name', '')) + len(field.get('value', '')) for field in embed.get('fields', []))
+        return length
+    
+    def pack_discord_embeds(self, embeds: List[Dict]) -> List[Dict]:
+        """Pack embeds, in order, into as few webhook messages as the Discord limits allow."""
+        messages = []
+        current = []
+        current_length = 0
+        for embed in embeds:
+            length = self.embed_length(embed)
+            if current and (len(current) == DISCORD_MAX_EMBEDS or
+                            current_length + length > DISCORD_MAX_MESSAGE_CHARS):
+                messages.append({"embeds": current})
+                current = []
+                current_length = 0
+            current.append(embed)
+            current_length += length
+        if current:
+            messages.append({"embeds": current})
+        return messages
+    
+    async def process_articles(self, session: aiohttp.ClientSession, articles: List[Dict]):
+        """Process articles through a translate -> format -> outbox -> deliver pipeline.
+        
+        Translations for all articles are requested up front, as one batch
+        (TRANSLATION_MODE=batch) or per text bounded by TRANSLATION_CONCURRENCY.
+        Each formatted (article, destination) delivery is written to the outbox
+        before it is sent, and one worker per destination drains the outbox in
+        significance order, so Discord can post article N+1 while Telegram is
+        still busy with article N. Deliveries left pending by earlier runs are
+        drained too. An article is marked processed only once every destination
+        has confirmed it.
+        """
+        destinations = self.delivery_destinations()
+        
+        if not articles and self.outbox.next_due(destinations) is None:
             log("No new articles to process")
             return
         
-        log(f"Processing {len(articles)} articles with Module 8 significance scoring")
-        log(f"Will deliver to: {len(self.discord_webhooks)} Discord server(s) + Telegram")
+        if not destinations:
+            log(f"No Discord webhook or Telegram configured, {len(articles)} article(s) left for a later run",
+                logging.WARNING)
+            return
+        
+        if articles:
+            log(f"Processing {len(articles)} articles with Module 8 significance scoring")
+            log(f"Will deliver to: {len(self.discord_webhooks)} Discord server(s) + Telegram")
         
-        for i, article in enumerate(articles, 1):
+        # Stage 1: translate (starts immediately for every article)
+        if self.config['translation_mode'] == 'batch':
+            texts = [text for article in articles for text in (article['title'], article['description'])]
+            batch = asyncio.create_task(self.translate_batch(session, texts))
+            
+            async def translate(index: int, article: Dict) -> Tuple[str, str]:
+                german = await batch
+                return german[2 * index], german[2 * index + 1]
+        else:
+            translation_slots = asyncio.Semaphore(self.config['translation_concurrency'])
+            
+            async def translate(index: int, article: Dict) -> Tuple[str, str]:
+                async with translation_slots:
+                    german_title, german_desc = await asyncio.gather(
+                        self.translate_to_german(session, article['title']),
+                        self.translate_to_german(session, article['description'])
+                    )
+                    return german_title, german_desc
+        
+        translations = [asyncio.create_task(translate(index, article)) for index, article in enumerate(articles)]
+        
+        # Stage 3: one outbox worker per destination
+        wake = {destination: asyncio.Event() for destination in destinations}
+        enqueued = asyncio.Event()
+        workers = [asyncio.create_task(self.drain_outbox(session, destination, wake[destination], enqueued))
+                   for destination in destinations]
+        
+        # Stage 2: format in significance order and record the deliveries
+        for i, (article, translation) in enumerate(zip(articles, translations), 1):
             try:
+                german_title, german_desc = await translation
+                
                 log(f"\nArticle {i}/{len(articles)}: {article['title'][:60]}...")
                 log(f"  Significance: {article['total_score']}/5 ({article['classification']})")
                 log(f"  Credibility: {article['credibility']}/5, Market: {article['market_impact']}/5, Relevance: {article['relevance']}/5")
                 
-                # Translate to German
-                german_title = await self.translate_to_german(article['title'])
-                await asyncio.sleep(0.5)
-                
-                german_desc = await self.translate_to_german(article['description'])
-                await asyncio.sleep(0.5)
-                
                 # Format for platforms
                 telegram_message = self.format_article_for_telegram(article, german_title, german_desc)
                 discord_embed = self.format_article_for_discord(article, german_title, german_desc)
                 
-                # Send to all Discord webhooks
-                await self.send_to_all_discord_webhooks(discord_embed)
-                await asyncio.sleep(0.5)
-                
-                # Send to Telegram
-                await self.send_to_telegram(telegram_message)
-                await asyncio.sleep(0.5)
-                
-                # Mark as processed
-                self.processed_articles.add(article['link'])
-                
+                deliveries = [(f"discord:{webhook_name}", discord_embed['embeds'][0])
+                              for webhook_name, _ in self.discord_webhooks]
+                if self.telegram_configured():
+                    deliveries.append(('telegram', telegram_message))
+                self.enqueue_article(article, deliveries)
+                for event in wake.values():
+                    event.set()
+            
             except Exception as e:
-                log(f"Error processing article {article['title']}: {e}")
+                log(f"Error processing article {article['title']}: {e}", logging.ERROR)
+        
+        enqueued.set()
+        for event in wake.values():
+            event.set()
+        await asyncio.gather(*workers)
     
-    async def run(self):
-        """Main execution function."""
+    def delivery_destinations(self) -> List[str]:
+        """Outbox destination names of the configured Discord webhooks and Telegram."""
+        destinations = [f"discord:{webhook_name}" for webhook_name, _ in self.discord_webhooks]
+        if self.telegram_configured():
+            destinations.append('telegram')
+        return destinations
+    
+    def retire_unconfigured_deliveries(self):
+        """Drop outbox deliveries to destinations removed from the config since they were queued.
+        
+        Nothing would ever claim them, so they would keep the daemon waking up
+        and keep their articles from being marked processed. A run with no
+        destination at all (e.g. missing secrets) keeps everything queued.
+        """
+        destinations = self.delivery_destinations()
+        if not destinations:
+            return
+        dropped, delivered = self.outbox.retire(destinations)
+        for data in delivered:
+            self.mark_delivered(data)
+        if dropped:
+            log(f"Outbox: dropped {dropped} delivery(ies) to destinations that are no longer configured",
+                logging.WARNING)
+    
+    def enqueue_article(self, article: Dict, deliveries: List[Tuple[str, object]]):
+        """Record an article's deliveries in the outbox.
+        
+        If an earlier run already delivered it everywhere, the article is
+        marked processed right away.
+        """
+        key = normalize_url(article['link'])
+        self.outbox.enqueue(key, {
+            'link': article['link'],
+            'duplicate_links': article.get('duplicate_links', []),
+            'sketch': article['sketch']
+        }, deliveries)
+        
+        delivered = self.outbox.delivered(key)
+        if delivered is not None:
+            self.mark_delivered(delivered)
+    
+    def mark_delivered(self, data: Dict):
+        """Mark a fully delivered article processed, including the copies folded into its story."""
+        self.processed_articles.add(data['link'])
+        self.processed_articles.update(data.get('duplicate_links', []))
+        self.story_index.add(data['sketch'])
+    
+    async def drain_outbox(self, session: aiohttp.ClientSession, destination: str,
+                           wake: asyncio.Event, enqueued: asyncio.Event):
+        """Deliver one destination's due outbox items, oldest first, until none are left.
+        
+        Once all new deliveries are enqueued, retries that come due within
+        OUTBOX_DRAIN_WAIT seconds are waited for; later ones stay pending for
+        the next run (or the next daemon wake-up).
+        """
+        batch_size = DISCORD_MAX_EMBEDS if (destination.startswith('discord:') and
+                                            self.config['discord_delivery'] == 'batch') else 1
+        deadline = None
+        while True:
+            items = self.outbox.claim(destination, batch_size)
+            if items:
+                await self.deliver_outbox_items(session, destination, items)
+                continue
+            
+            if not enqueued.is_set():
+                await wake.wait()
+                wake.clear()
+                continue
+            
+            delay = self.outbox.next_due([destination])
+            if delay is None:
+                return
+            if deadline is None:
+                deadline = time.monotonic() + self.config['outbox_drain_wait']
+            if time.monotonic() + delay > deadline:
+                log(f"{destination}: retry due in {delay:.0f}s, left pending in the outbox")
+                return
+            await asyncio.sleep(delay)
+    
+    async def deliver_outbox_items(self, session: aiohttp.ClientSession, destination: str, items: List[Dict]):
+        """Send claimed outbox items and record each outcome.
+        
+        Discord items are embeds, packed into as few messages as the limits
+        allow; Telegram items are message texts. Network errors, timeouts, 429
+        and 5xx are retried with backoff, other statuses fail permanently.
+        """
+        if destination == 'telegram':
+            groups = [([item], item['payload']) for item in items]
+        else:
+            webhook_url = dict(self.discord_webhooks)[destination.split(':', 1)[1]]
+            groups = []
+            position = 0
+            for message in self.pack_discord_embeds([item['payload'] for item in items]):
+                groups.append((items[position:position + len(message['embeds'])], message))
+                position += len(message['embeds'])
+        
+        for group, payload in groups:
+            ids = [item['id'] for item in group]
+            status = None
+            try:
+                with self.profiler.span('deliver', destination):
+                    if destination == 'telegram':
+                        status = await self.post_telegram(session, payload)
+                    else:
+                        status = await self.post_discord(session, webhook_url, payload)
+                error = None if status in [200, 204] else f"HTTP {status}"
+            except asyncio.TimeoutError:
+                error = "timed out"
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            
+            if error is None:
+                self.metrics.inc('articles_delivered', len(ids), destination=destination)
+                for delivered in self.outbox.complete(ids):
+                    self.mark_delivered(delivered)
+                if destination == 'telegram':
+                    log("Sent to Telegram: " + payload.split('\n')[0][:50] + "...")
+                else:
+                    log(f"Sent {len(ids)} embed(s) to {destination[len('discord:'):]}: {payload['embeds'][0]['title'][:50]}...")
+            else:
+                retry = status is None or status >= 500 or status in [408, 429]
+                self.outbox.fail(ids, error, retry)
+                log(f"{destination} delivery failed ({error}), {'will retry' if retry else 'giving up'}", logging.WARNING)
+    
+    def report_outbox(self):
+        """Drop old finished outbox entries and log delivery counts."""
+        try:
+            removed = self.outbox.prune()
+            stats = self.outbox.stats()
+            log(f"Outbox: {stats['done']} done, {stats['pending']} pending, {stats['failed']} failed "
+                f"({removed} article(s) pruned)")
+        except Exception as e:
+            log(f"Outbox error: {e}", logging.ERROR)
+    
+    def rank_articles(self, articles: List[Dict]) -> List[Dict]:
+        """Keep articles at or above the minimum significance score, sorted highest first."""
+        ranked = [a for a in articles 
+                  if a['total_score'] >= self.config['min_significance_score']]
+        ranked.sort(key=lambda x: x['total_score'], reverse=True)
+        return ranked
+    
+    def report_translation_cache(self):
+        """Evict stale translation cache entries and log hit/miss counters."""
+        try:
+            removed = self.translation_cache.prune()
+            stats = self.translation_cache.stats()
+            log(f"Translation cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['entries']} entries ({removed} evicted)")
+        except Exception as e:
+            log(f"Translation cache error: {e}", logging.ERROR)
+    
+    def report_profile(self):
+        """Log per-stage p50/p95 and append the full profile to PROFILE_FILE (empty disables the file)."""
+        try:
+            if self.config['profile_file']:
+                rows = self.profiler.write(self.config['profile_file'])
+            else:
+                rows = self.profiler.summary()
+                self.profiler = Profiler()
+            for row in rows:
+                if row['key'] is None:
+                    log(f"  {row['stage']:12s} n={row['count']:<4d} p50={row['p50_ms']:.0f} ms "
+                        f"p95={row['p95_ms']:.0f} ms total={row['total_ms']:.0f} ms")
+        except Exception as e:
+            log(f"Profile error: {e}", logging.ERROR)
+    
+    def log_banner(self):
+        """Log the startup banner with the active configuration."""
         log("=" * 80)
         log("FFI CRYPTO NEWS BOT - MODULE 8 ENHANCED EDITION")
         log("Advanced News Analysis + Dual-Language + Multi-Platform")
@@ -886,74 +1861,229 @@ class FFICryptoNewsBot:
         log(f"Translation: {'Enabled (OpenAI)' if self.config['openai_api_key'] else 'Disabled'}")
         log(f"Min Significance Score: {self.config['min_significance_score']}")
         log("=" * 80)
+    
+    async def process_cycle(self, session: aiohttp.ClientSession, fetched_articles: List[Dict]):
+        """Cluster, score, translate and deliver fetched articles, then save state."""
+        # Fold copies of the same story into one
+        with self.profiler.span('cluster'):
+            all_articles = self.story_clusterer.cluster(fetched_articles)
+        if len(all_articles) < len(fetched_articles):
+            log(f"\nMerged {len(fetched_articles) - len(all_articles)} near-duplicate article(s) "
+                f"into {len(all_articles)} stories")
+        
+        # Score everything at once, keep the top max_articles above the minimum score
+        with self.profiler.span('score'):
+            articles_to_process, eligible_count = self.score_batch(all_articles)
+        
+        log(f"\nFound {len(all_articles)} total new articles")
+        log(f"After filtering (score >= {self.config['min_significance_score']}): {eligible_count} articles")
+        log(f"Processing top {len(articles_to_process)} by significance score")
+        
+        # Process and send articles
+        await self.process_articles(session, articles_to_process)
+        
+        # Save processed articles
+        self.save_processed_articles()
+        self.report_translation_cache()
+        self.report_outbox()
+    
+    async def run_portfolio_update(self, session: aiohttp.ClientSession):
+        """Load the portfolio, fetch prices and send the portfolio update."""
+        log("\n" + "=" * 80)
+        log("STARTING PORTFOLIO TRACKING")
+        log("=" * 80)
         
         try:
-            # Fetch articles from all RSS feeds
-            async with aiohttp.ClientSession() as session:
-                tasks = [self.fetch_rss_feed(session, name, feed_data) 
-                        for name, feed_data in self.rss_feeds.items()]
-                results = await asyncio.gather(*tasks)
-            
-            # Flatten articles
-            all_articles = [article for sublist in results for article in sublist]
-            
-            # Filter by minimum significance score
-            filtered_articles = [a for a in all_articles 
-                               if a['total_score'] >= self.config['min_significance_score']]
-            
-            # Sort by significance score (highest first)
-            filtered_articles.sort(key=lambda x: x['total_score'], reverse=True)
-            
-            # Limit to max articles
-            articles_to_process = filtered_articles[:self.config['max_articles']]
-            
-            log(f"\nFound {len(all_articles)} total new articles")
-            log(f"After filtering (score >= {self.config['min_significance_score']}): {len(filtered_articles)} articles")
-            log(f"Processing top {len(articles_to_process)} by significance score")
-            
-            # Process and send articles
-            await self.process_articles(articles_to_process)
-            
-            # Save processed articles
-            self.save_processed_articles()
-            
-            log("\n" + "=" * 80)
-            
-            # Portfolio tracking
-            log("\n" + "=" * 80)
-            log("STARTING PORTFOLIO TRACKING")
-            log("=" * 80)
-            
-            try:
+            with self.profiler.span('csv_load'):
                 tiers = await self.load_portfolio_from_csv()
-                all_symbols = []
-                for tier_data in tiers.values():
-                    all_symbols.extend([coin['symbol'] for coin in tier_data['coins']])
-                
-                prices = await self.fetch_coin_prices(all_symbols)
+            all_symbols = []
+            for tier_data in tiers.values():
+                all_symbols.extend([coin['symbol'] for coin in tier_data['coins']])
+            
+            with self.profiler.span('price_fetch'):
+                prices = await self.fetch_coin_prices(session, all_symbols)
+            with self.profiler.span('signals'):
                 signals = self.analyze_portfolio_signals(tiers, prices)
-                await self.send_portfolio_update(tiers, prices, signals)
-                
-                log("Portfolio tracking completed successfully")
-            except Exception as e:
-                log(f"Portfolio tracking error: {e}")
+            await self.send_portfolio_update(session, tiers, prices, signals)
             
+            log("Portfolio tracking completed successfully")
+        except Exception as e:
+            log(f"Portfolio tracking error: {e}", logging.ERROR)
+    
+    async def run(self):
+        """Main execution function."""
+        self.log_banner()
+        
+        try:
+            # One pooled session serves every fetch and send of this run
+            with self.profiler.span('run'):
+                async with self.create_http_session() as session:
+                    # Fetch articles from all RSS feeds
+                    tasks = [self.fetch_rss_feed(session, name, feed_data) 
+                            for name, feed_data in self.rss_feeds.items()]
+                    results = await asyncio.gather(*tasks)
+                    
+                    log("\nFeed fetch summary:")
+                    self.report_feed_stats()
+                    log("\nFilter stages:")
+                    self.report_filter_stats()
+                    
+                    await self.process_cycle(session, [article for sublist in results for article in sublist])
+                    
+                    log("\n" + "=" * 80)
+                    
+                    # Portfolio tracking
+                    await self.run_portfolio_update(session)
+            
+            log("\nRun profile:")
+            self.report_profile()
             log("FFI CRYPTO NEWS BOT COMPLETED SUCCESSFULLY")
             log("=" * 80)
-            
+        
         except Exception as e:
-            log(f"Critical error: {e}")
+            log(f"Critical error: {e}", logging.ERROR)
             raise
+    
+    async def sleep_until_stopped(self, stop: asyncio.Event, seconds: float) -> bool:
+        """Sleep up to seconds; returns True as soon as stop is set."""
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def poll_feed(self, session: aiohttp.ClientSession, name: str, feed_data: Dict,
+                        pending: List[Dict], arrived: asyncio.Event, stop: asyncio.Event):
+        """Daemon loop for one feed: fetch, queue new articles, sleep until its next poll.
+        
+        The delay is the feed's fixed 'poll_interval' if configured, otherwise
+        the interval the feed scheduler learned from its publish rate.
+        """
+        while not stop.is_set():
+            articles = await self.fetch_rss_feed(session, name, feed_data)
+            if articles:
+                pending.extend(articles)
+                arrived.set()
+            
+            if 'poll_interval' in feed_data:
+                jitter = self.config['feed_poll_jitter']
+                delay = feed_data['poll_interval'] * random.uniform(1 - jitter, 1 + jitter)
+            else:
+                delay = self.feed_scheduler.next_delay(self.feed_state.setdefault(name, {}))
+            log(f"{name}: next poll in {delay:.0f}s")
+            if await self.sleep_until_stopped(stop, delay):
+                return
+    
+    async def poll_portfolio(self, session: aiohttp.ClientSession, stop: asyncio.Event):
+        """Daemon loop for the portfolio update."""
+        while not stop.is_set():
+            await self.run_portfolio_update(session)
+            if await self.sleep_until_stopped(stop, self.config['portfolio_interval_hours'] * 3600):
+                return
+    
+    async def run_daemon(self):
+        """Stay resident: poll every feed on its own interval and deliver as news arrives.
+        
+        The HTTP pool, dedup index, story index and translation cache stay warm
+        between polls. Articles from all feeds are gathered for DAEMON_BATCH_DELAY
+        seconds after the first arrival so copies of one story still cluster, and
+        outbox retries are sent when they come due. The run profile is written
+        after every batch; with METRICS_PORT set, counters and histograms are
+        served at /metrics. SIGTERM/SIGINT stop polling, deliver what was
+        already fetched and save state.
+        """
+        self.log_banner()
+        log(f"Daemon mode: polling {len(self.rss_feeds)} feeds every "
+            f"{self.config['feed_poll_min_interval']}-{self.config['feed_poll_max_interval']}s by publish rate")
+        
+        stop = asyncio.Event()
+        arrived = asyncio.Event()
+        pending: List[Dict] = []
+        
+        def request_stop():
+            log("Shutdown requested, finishing current batch")
+            stop.set()
+            arrived.set()
+        
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, request_stop)
+            except NotImplementedError:
+                pass  # Windows: KeyboardInterrupt still ends the loop
+        
+        if self.config['metrics_port']:
+            try:
+                await self.metrics.start(self.config['metrics_port'], self.config['metrics_host'])
+                log(f"Metrics at http://{self.config['metrics_host']}:{self.config['metrics_port']}/metrics")
+            except OSError as e:
+                log(f"Metrics endpoint unavailable: {e}", logging.WARNING)
+        
+        async with self.create_http_session() as session:
+            pollers = [asyncio.create_task(self.poll_feed(session, name, feed_data, pending, arrived, stop))
+                       for name, feed_data in self.rss_feeds.items()]
+            pollers.append(asyncio.create_task(self.poll_portfolio(session, stop)))
+            
+            try:
+                while not stop.is_set():
+                    # Wake for new articles, or when an outbox retry comes due
+                    try:
+                        await asyncio.wait_for(arrived.wait(),
+                                               timeout=self.outbox.next_due(self.delivery_destinations()))
+                    except asyncio.TimeoutError:
+                        pass
+                    if arrived.is_set():
+                        await self.sleep_until_stopped(stop, self.config['daemon_batch_delay'])
+                    arrived.clear()
+                    
+                    batch = pending[:]
+                    pending.clear()
+                    try:
+                        if batch:
+                            await self.process_cycle(session, batch)
+                            self.report_profile()
+                        elif not stop.is_set():
+                            await self.process_articles(session, [])
+                            self.save_processed_articles()
+                    except Exception as e:
+                        log(f"Processing error: {e}", logging.ERROR)
+            finally:
+                for task in pollers:
+                    task.cancel()
+                await asyncio.gather(*pollers, return_exceptions=True)
+                
+                # Fetching advanced the feed high-water marks; deliver before saving them
+                if pending:
+                    try:
+                        await self.process_cycle(session, pending[:])
+                    except Exception as e:
+                        log(f"Processing error: {e}", logging.ERROR)
+                self.save_processed_articles()
+                self.report_profile()
+                self.translation_cache.close()
+                self.outbox.close()
+                self.parse_executor.shutdown()
+                await self.metrics.stop()
+        
+        log("FFI CRYPTO NEWS BOT STOPPED")
+        log("=" * 80)
 
 def main():
     """Entry point for the bot."""
+    parser = argparse.ArgumentParser(description='FFI Crypto News Bot')
+    parser.add_argument('--daemon', action='store_true',
+                        help='stay resident and poll feeds continuously instead of running once')
+    args = parser.parse_args()
+    
+    setup_logging(os.getenv('LOG_LEVEL', 'INFO'), os.getenv('LOG_FORMAT', 'text'))
+    
     try:
         bot = FFICryptoNewsBot()
-        asyncio.run(bot.run())
+        asyncio.run(bot.run_daemon() if args.daemon else bot.run())
     except KeyboardInterrupt:
         log("Bot stopped by user")
     except Exception as e:
-        log(f"Fatal error: {e}")
+        log(f"Fatal error: {e}", logging.ERROR)
         raise
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""
+Keyword Matcher - Single-pass multi-category keyword scanning
+One compiled regex finds every keyword of every category in one scan of the text
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+# Plural and tense endings accepted after a keyword ("etfs", "hacked", "gains")
+KEYWORD_SUFFIXES = ('', 's', 'es', 'ed', 'ing')
+
+
+def spellings_of(keyword: str) -> List[str]:
+    """Accepted spellings of a keyword, including y -> ies/ied ("rallies", "cryptocurrencies")."""
+    spellings = [keyword + suffix for suffix in KEYWORD_SUFFIXES]
+    if keyword.endswith('y') and len(keyword) > 2:
+        spellings += [keyword[:-1] + 'ies', keyword[:-1] + 'ied']
+    return spellings
+
+
+def _trie_to_regex(node: Dict) -> str:
+    """Turn a character trie into a prefix-factored regex (re has no trie optimisation)."""
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    optional = '' in node
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')' + ('?' if optional else '')
+
+
+class KeywordMatcher:
+    """Precompiled word-boundary matcher over named keyword categories.
+    
+    Keywords overlapping in the text are all found, and prefix stems match
+    any word they start:
+    
+    >>> matcher = KeywordMatcher({'crypto': ['crypto', 'cryptocurrency', 'bitcoin', 'eth'],
+    ...                           'relevance_major': ['crypto market'],
+    ...                           'impact_medium': ['market cap'],
+    ...                           'positive': ['rally', 'up']},
+    ...                          prefix_stems=['crypto', 'bitcoin'])
+    >>> sorted(matcher.scan('Cryptocurrencies slump as dollar rallies')['crypto'])
+    ['cryptocurrency']
+    >>> sorted(matcher.scan('Dollar rallies')['positive'])
+    ['rally']
+    >>> sorted(matcher.scan('Bitcoiners cheer as stablecoin cryptos grow')['crypto'])
+    ['bitcoin', 'crypto']
+    >>> hits = matcher.scan('Crypto market cap tops $3T')
+    >>> sorted(hits['relevance_major']), sorted(hits['impact_medium']), sorted(hits['crypto'])
+    (['crypto market'], ['market cap'], ['crypto'])
+    >>> dict(matcher.scan('A new method to update the app'))
+    {}
+    """
+    
+    def __init__(self, categories: Dict[str, List[str]], prefix_stems: Iterable[str] = ()):
+        """Build the combined pattern from {category: [keywords]}.
+        
+        prefix_stems are keywords that also match as the start of a longer
+        word ("crypto" in "cryptos", "bitcoin" in "bitcoiners").
+        """
+        keyword_categories: Dict[str, Set[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword.lower(), set()).add(category)
+        
+        # Every accepted spelling ("etfs", "hacked") resolved to its keyword up front
+        keywords = sorted(keyword_categories, key=len, reverse=True)
+        self.spellings = {}
+        for keyword in keywords:
+            for spelling in spellings_of(keyword):
+                self.spellings.setdefault(spelling, keyword)
+        
+        # Greedy trie over all spellings: "crypto market" wins over "crypto" at the
+        # same position. The lookahead tries every word start, so overlapping
+        # keywords ("crypto market" and "market cap") are all found.
+        trie: Dict = {}
+        for spelling in self.spellings:
+            node = trie
+            for char in spelling:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        stems = sorted({stem.lower() for stem in prefix_stems} & set(keyword_categories), key=len, reverse=True)
+        stem_pattern = '|'.join(re.escape(stem) for stem in stems) or '(?!)'
+        self.pattern = re.compile(rf'\b(?=(?:({_trie_to_regex(trie)})\b|({stem_pattern})[a-z]*\b))')
+        
+        # A long keyword also counts for every shorter keyword it contains as
+        # whole words ("crypto market" -> "crypto"), which the single scan skips
+        word_patterns = {keyword: re.compile(rf'\b{re.escape(keyword)}\b') for keyword in keywords}
+        self.implied_hits: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        for keyword in keywords:
+            hits = []
+            for other in keywords:
+                if len(other) <= len(keyword) and word_patterns[other].search(keyword):
+                    hits.extend((category, other) for category in keyword_categories[other])
+            self.implied_hits[keyword] = tuple(hits)
+    
+    def keywords_in(self, text: str) -> Iterator[str]:
+        """Keyword of every hit in the text, in order (a keyword may repeat)."""
+        for spelling, stem in self.pattern.findall(text.lower()):
+            yield self.spellings[spelling] if spelling else stem
+    
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """Scan text once and return {category: matched keywords}; unmatched categories read as empty."""
+        hits: Dict[str, Set[str]] = defaultdict(set)
+        for keyword in self.keywords_in(text):
+            for category, implied in self.implied_hits[keyword]:
+                hits[category].add(implied)
+        return hits
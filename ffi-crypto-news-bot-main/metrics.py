@@ -0,0 +1,109 @@
+"""
+Metrics - In-process counters and histograms with a Prometheus text endpoint
+Served by aiohttp on a local port so the resident bot can be scraped and alerted on
+"""
+
+import bisect
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+# Latency buckets in seconds (upper bounds, +Inf is implied)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Render labels as {name="value",...}, escaped per the text exposition format."""
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Metrics:
+    """Registry of counters and histograms, rendered on each scrape.
+    
+    Recording is always on and costs a dict update; the HTTP endpoint is
+    only started when a port is configured.
+    """
+    
+    def __init__(self, prefix: str = 'ffi_bot', buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self.help: Dict[str, Tuple[str, str]] = {}  # name -> (type, help text)
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.histograms: Dict[str, Dict[Labels, list]] = {}  # [bucket counts..., sum, count]
+        self.runner: Optional[web.AppRunner] = None
+    
+    def counter(self, name: str, help_text: str):
+        """Declare a counter (its exported name gets the prefix and a _total suffix)."""
+        self.help[name] = ('counter', help_text)
+        self.counters.setdefault(name, {})
+    
+    def histogram(self, name: str, help_text: str):
+        """Declare a histogram of seconds."""
+        self.help[name] = ('histogram', help_text)
+        self.histograms.setdefault(name, {})
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a declared counter."""
+        series = self.counters[name]
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+    
+    def observe(self, name: str, seconds: float, **labels):
+        """Record one sample in a declared histogram."""
+        series = self.histograms[name]
+        key = tuple(sorted(labels.items()))
+        if key not in series:
+            series[key] = [0] * len(self.buckets) + [0.0, 0]
+        state = series[key]
+        index = bisect.bisect_left(self.buckets, seconds)
+        if index < len(self.buckets):
+            state[index] += 1
+        state[-2] += seconds
+        state[-1] += 1
+    
+    def render(self) -> str:
+        """All series in the Prometheus text exposition format."""
+        lines = []
+        for name, (kind, help_text) in self.help.items():
+            exported = f"{self.prefix}_{name}" + ('_total' if kind == 'counter' else '')
+            lines.append(f"# HELP {exported} {help_text}")
+            lines.append(f"# TYPE {exported} {kind}")
+            if kind == 'counter':
+                for labels, value in sorted(self.counters[name].items()):
+                    lines.append(f"{exported}{format_labels(labels)} {value:g}")
+                continue
+            
+            for labels, state in sorted(self.histograms[name].items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, state):
+                    cumulative += count
+                    lines.append(f"{exported}_bucket{format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+                lines.append(f"{exported}_bucket{format_labels(labels, ('le', '+Inf'))} {state[-1]}")
+                lines.append(f"{exported}_sum{format_labels(labels)} {state[-2]:.6f}")
+                lines.append(f"{exported}_count{format_labels(labels)} {state[-1]}")
+        return '\n'.join(lines) + '\n'
+    
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.render(), content_type='text/plain', charset='utf-8',
+                            headers={'X-Content-Type-Options': 'nosniff'})
+    
+    async def start(self, port: int, host: str = '127.0.0.1'):
+        """Serve GET /metrics on host:port until stop()."""
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+    
+    async def stop(self):
+        """Shut the endpoint down."""
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
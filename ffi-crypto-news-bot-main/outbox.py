@@ -0,0 +1,249 @@
+"""
+Outbox - Durable SQLite queue of outbound deliveries
+One row per (article, destination), retried with exponential backoff and resumed after a crash
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Delivery states
+PENDING = 'pending'
+IN_FLIGHT = 'in_flight'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class Outbox:
+    """Persistent delivery queue; an article counts as delivered once every destination is done.
+    
+    >>> import os, tempfile
+    >>> tmp = tempfile.TemporaryDirectory()
+    >>> path = os.path.join(tmp.name, 'outbox.db')
+    >>> outbox = Outbox(path)
+    >>> outbox.enqueue('a', {'link': 'https://a'}, [('discord:FFI', {'title': 'A'}), ('telegram', 'A')])
+    True
+    >>> outbox.enqueue('a', {'link': 'https://a'}, [('telegram', 'A')])
+    False
+    >>> [item['payload'] for item in outbox.claim('telegram')]
+    ['A']
+    >>> outbox.claim('telegram')
+    []
+    
+    A send in flight when the process dies is sent again after a restart,
+    and a failed one waits out its backoff:
+    
+    >>> outbox.close()
+    >>> outbox = Outbox(path)
+    >>> outbox.recovered
+    1
+    >>> telegram = [item['id'] for item in outbox.claim('telegram')]
+    >>> outbox.fail(telegram, 'HTTP 503')
+    >>> outbox.claim('telegram'), 4 < outbox.next_due(['telegram']) <= 5
+    ([], True)
+    >>> outbox.complete([item['id'] for item in outbox.claim('discord:FFI')])
+    []
+    >>> outbox.fail(telegram, 'HTTP 400', retry=False)
+    >>> outbox.delivered('a') is None, outbox.stats()
+    (True, {'pending': 0, 'in_flight': 0, 'done': 1, 'failed': 1})
+    >>> outbox.enqueue('b', {'link': 'https://b'}, [('telegram', 'B')])
+    True
+    >>> outbox.complete([item['id'] for item in outbox.claim('telegram')])
+    [{'link': 'https://b'}]
+    
+    Retiring destinations never turns an article nobody received into a
+    delivered one:
+    
+    >>> outbox.enqueue('c', {'link': 'https://c'}, [('discord:FFI', {}), ('telegram', 'C')])
+    True
+    >>> outbox.retire([])
+    (0, [])
+    >>> outbox.retire(['discord:Main'])
+    (2, [])
+    >>> outbox.delivered('c') is None
+    True
+    >>> outbox.close()
+    >>> tmp.cleanup()
+    """
+    
+    def __init__(self, path: str, max_attempts: int = 6, base_delay: float = 5, max_delay: float = 900):
+        """Open (or create) the outbox database and requeue deliveries interrupted by a crash."""
+        self.path = path
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " article_key TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS deliveries ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " article_key TEXT NOT NULL,"
+            " destination TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " next_attempt_at REAL NOT NULL,"
+            " last_error TEXT,"
+            " updated_at REAL NOT NULL,"
+            " UNIQUE (article_key, destination))"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_deliveries_due ON deliveries (destination, state, next_attempt_at)")
+        
+        # Sends that were in flight when the last process died may or may not have
+        # arrived; sending them again (at-least-once) beats losing them
+        self.recovered = self.db.execute(
+            "UPDATE deliveries SET state = ? WHERE state = ?", (PENDING, IN_FLIGHT)
+        ).rowcount
+        self.db.commit()
+    
+    def enqueue(self, article_key: str, data: Dict, deliveries: List[Tuple[str, object]]) -> bool:
+        """Record an article and its (destination, payload) deliveries as pending.
+        
+        data is what the caller needs back once the article is delivered (see
+        complete). Already known (article, destination) pairs are left alone.
+        Returns True if anything new was queued.
+        """
+        now = time.time()
+        with self.db:
+            self.db.execute(
+                "INSERT OR IGNORE INTO articles (article_key, data, created_at) VALUES (?, ?, ?)",
+                (article_key, json.dumps(data), now)
+            )
+            queued = 0
+            for destination, payload in deliveries:
+                queued += self.db.execute(
+                    "INSERT OR IGNORE INTO deliveries"
+                    " (article_key, destination, payload, state, next_attempt_at, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (article_key, destination, json.dumps(payload), PENDING, now, now)
+                ).rowcount
+        return queued > 0
+    
+    def claim(self, destination: str, limit: int = 1) -> List[Dict]:
+        """Mark up to limit due deliveries for a destination in flight and return them, oldest first."""
+        rows = self.db.execute(
+            "SELECT id, article_key, payload, attempts FROM deliveries"
+            " WHERE destination = ? AND state = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+            (destination, PENDING, time.time(), limit)
+        ).fetchall()
+        if not rows:
+            return []
+        
+        with self.db:
+            self.db.executemany(
+                "UPDATE deliveries SET state = ?, updated_at = ? WHERE id = ?",
+                [(IN_FLIGHT, time.time(), row['id']) for row in rows]
+            )
+        return [{'id': row['id'], 'article_key': row['article_key'], 'attempts': row['attempts'],
+                 'payload': json.loads(row['payload'])} for row in rows]
+    
+    def complete(self, ids: List[int]) -> List[Dict]:
+        """Mark deliveries done; returns the data of articles that are now delivered everywhere."""
+        with self.db:
+            self.db.executemany(
+                "UPDATE deliveries SET state = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+                [(DONE, time.time(), delivery_id) for delivery_id in ids]
+            )
+        keys = {row[0] for row in self.db.execute(
+            f"SELECT DISTINCT article_key FROM deliveries WHERE id IN ({','.join('?' * len(ids))})", ids
+        )} if ids else set()
+        return [data for key in sorted(keys) for data in [self.delivered(key)] if data is not None]
+    
+    def delivered(self, article_key: str) -> Optional[Dict]:
+        """The article's data if it has deliveries and every one of them is done, else None."""
+        done, outstanding = self.db.execute(
+            "SELECT COALESCE(SUM(state = ?), 0), COALESCE(SUM(state != ?), 0) FROM deliveries"
+            " WHERE article_key = ?", (DONE, DONE, article_key)
+        ).fetchone()
+        if outstanding or not done:
+            return None
+        row = self.db.execute("SELECT data FROM articles WHERE article_key = ?", (article_key,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def fail(self, ids: List[int], error: str, retry: bool = True):
+        """Put deliveries back with exponential backoff, or mark them failed when out of attempts."""
+        now = time.time()
+        with self.db:
+            for delivery_id in ids:
+                attempts = self.db.execute(
+                    "SELECT attempts FROM deliveries WHERE id = ?", (delivery_id,)
+                ).fetchone()[0] + 1
+                if retry and attempts < self.max_attempts:
+                    delay = min(self.base_delay * 2 ** (attempts - 1), self.max_delay)
+                    state = PENDING
+                else:
+                    delay = 0
+                    state = FAILED
+                self.db.execute(
+                    "UPDATE deliveries SET state = ?, attempts = ?, next_attempt_at = ?, last_error = ?,"
+                    " updated_at = ? WHERE id = ?",
+                    (state, attempts, now + delay, error[:500], now, delivery_id)
+                )
+    
+    def next_due(self, destinations: Iterable[str]) -> Optional[float]:
+        """Seconds until the next pending delivery to one of destinations is due; None if none."""
+        destinations = list(destinations)
+        if not destinations:
+            return None
+        due = self.db.execute(
+            f"SELECT MIN(next_attempt_at) FROM deliveries WHERE state = ?"
+            f" AND destination IN ({','.join('?' * len(destinations))})",
+            [PENDING] + destinations
+        ).fetchone()[0]
+        return None if due is None else max(0.0, due - time.time())
+    
+    def retire(self, destinations: Iterable[str]) -> Tuple[int, List[Dict]]:
+        """Drop unfinished deliveries to destinations that are no longer configured.
+        
+        Returns how many were dropped and the data of articles that are now
+        delivered everywhere they still had to go. An empty destination list
+        means the config is missing, not that every destination went away, so
+        nothing is dropped.
+        """
+        destinations = list(destinations)
+        if not destinations:
+            return 0, []
+        condition = f"state IN (?, ?) AND destination NOT IN ({','.join('?' * len(destinations))})"
+        params = [PENDING, IN_FLIGHT] + destinations
+        with self.db:
+            keys = {row[0] for row in self.db.execute(
+                f"SELECT DISTINCT article_key FROM deliveries WHERE {condition}", params
+            )}
+            dropped = self.db.execute(f"DELETE FROM deliveries WHERE {condition}", params).rowcount
+        return dropped, [data for key in sorted(keys) for data in [self.delivered(key)] if data is not None]
+    
+    def stats(self) -> Dict[str, int]:
+        """Delivery counts per state."""
+        counts = {PENDING: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update(self.db.execute("SELECT state, COUNT(*) FROM deliveries GROUP BY state").fetchall())
+        return counts
+    
+    def prune(self, max_age_days: int = 7) -> int:
+        """Drop articles whose deliveries all finished (done or failed) more than max_age_days ago."""
+        cutoff = time.time() - max_age_days * 86400
+        with self.db:
+            keys = [row[0] for row in self.db.execute(
+                "SELECT article_key FROM deliveries GROUP BY article_key"
+                " HAVING SUM(state IN (?, ?)) = 0 AND MAX(updated_at) < ?",
+                (PENDING, IN_FLIGHT, cutoff)
+            )]
+            self.db.executemany("DELETE FROM deliveries WHERE article_key = ?", [(key,) for key in keys])
+            self.db.executemany("DELETE FROM articles WHERE article_key = ?", [(key,) for key in keys])
+            # Articles that had no destination to deliver to
+            removed = self.db.execute(
+                "DELETE FROM articles WHERE created_at < ? AND article_key NOT IN"
+                " (SELECT article_key FROM deliveries)", (cutoff,)
+            ).rowcount
+        return len(keys) + removed
+    
+    def close(self):
+        """Close the database connection."""
+        self.db.close()
@@ -0,0 +1,82 @@
+"""
+Profiling - Timing spans for each stage of a bot run
+Aggregates durations per stage and key (feed, destination) into p50/p95 and writes them as JSON lines
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Profiler:
+    """Collects (stage, key, seconds) spans until they are reported.
+    
+    Spans may overlap; the profile shows where each stage spends its time,
+    not a breakdown of the run's wall clock.
+    """
+    
+    def __init__(self):
+        self.spans: Dict[Tuple[str, Optional[str]], List[float]] = {}
+        self.started = time.time()
+    
+    @contextmanager
+    def span(self, stage: str, key: Optional[str] = None):
+        """Time the enclosed block (awaits included) as one span of the stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, key)
+    
+    def record(self, stage: str, seconds: float, key: Optional[str] = None):
+        """Add a span measured elsewhere, e.g. in a parse worker."""
+        self.spans.setdefault((stage, key), []).append(seconds)
+    
+    def summary(self) -> List[Dict]:
+        """One row per stage (key None, all keys combined) followed by its per-key rows."""
+        by_stage: Dict[str, List[float]] = {}
+        for (stage, _), durations in self.spans.items():
+            by_stage.setdefault(stage, []).extend(durations)
+        
+        rows = []
+        for stage in by_stage:
+            keyed = sorted((key, durations) for (name, key), durations in self.spans.items()
+                           if name == stage and key is not None)
+            for key, durations in [(None, by_stage[stage])] + keyed:
+                ordered = sorted(durations)
+                rows.append({
+                    'stage': stage,
+                    'key': key,
+                    'count': len(ordered),
+                    'total_ms': round(sum(ordered) * 1000, 2),
+                    'p50_ms': round(percentile(ordered, 50) * 1000, 2),
+                    'p95_ms': round(percentile(ordered, 95) * 1000, 2),
+                    'max_ms': round(ordered[-1] * 1000, 2)
+                })
+        return rows
+    
+    def write(self, path: str) -> List[Dict]:
+        """Append the summary to a JSON lines file and start a new profile.
+        
+        Every line carries the profile's start time so runs can be told apart.
+        Returns the rows written.
+        """
+        rows = self.summary()
+        started = datetime.fromtimestamp(self.started, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        if rows:
+            with open(path, 'a') as f:
+                for row in rows:
+                    f.write(json.dumps({'run': started, **row}) + '\n')
+        
+        self.spans = {}
+        self.started = time.time()
+        return rows
@@ -0,0 +1,133 @@
+"""
+Rate Limiter - Per-destination token buckets for webhook and bot API delivery
+Honors Retry-After on 429 and Discord's X-RateLimit-* headers
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Mapping, Optional
+
+import aiohttp
+
+
+class TokenBucket:
+    """Token bucket for one destination; the server's rate-limit headers override the local estimate."""
+    
+    def __init__(self, rate: float, burst: int):
+        """rate is tokens per second, burst the bucket size."""
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # set by 429s and exhausted server buckets
+        self.reset_at: Optional[float] = None  # server bucket refills completely at this time
+    
+    def refill(self, now: float):
+        """Add the tokens earned since the last update."""
+        if self.reset_at is not None and now >= self.reset_at:
+            self.tokens = float(self.capacity)
+            self.reset_at = None
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token can be taken (0 when one is available)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Independent token buckets keyed by destination (webhook URL, chat id).
+    
+    Different keys never wait for each other, so destinations can be served
+    in parallel while each stays within its own limit.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1, on_throttle: Optional[Callable[[str], None]] = None):
+        """Defaults for every destination's bucket until its server headers say otherwise.
+        
+        on_throttle(key) is called for every 429 received, retried or not.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.on_throttle = on_throttle
+        self.buckets: Dict[str, TokenBucket] = {}
+    
+    def bucket(self, key: str) -> TokenBucket:
+        """The destination's bucket, created on first use."""
+        if key not in self.buckets:
+            self.buckets[key] = TokenBucket(self.rate, self.burst)
+        return self.buckets[key]
+    
+    async def acquire(self, key: str):
+        """Wait until the destination may be sent to, then take a token."""
+        bucket = self.bucket(key)
+        while True:
+            now = time.monotonic()
+            bucket.refill(now)
+            wait = bucket.wait_time(now)
+            if wait <= 0:
+                bucket.tokens -= 1
+                return
+            await asyncio.sleep(wait)
+    
+    def record(self, key: str, status: int, headers: Mapping[str, str], retry_after: Optional[float] = None):
+        """Update a destination's bucket from a response.
+        
+        retry_after (seconds) overrides the Retry-After header, e.g. when it
+        came from a JSON error body.
+        """
+        bucket = self.bucket(key)
+        now = time.monotonic()
+        
+        limit = headers.get('X-RateLimit-Limit')
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_after = headers.get('X-RateLimit-Reset-After')
+        try:
+            if limit is not None:
+                bucket.capacity = max(1, int(limit))
+            if remaining is not None:
+                bucket.tokens = min(bucket.tokens, float(remaining))
+                if reset_after is not None:
+                    bucket.reset_at = now + float(reset_after)
+                    if int(remaining) == 0:
+                        bucket.blocked_until = max(bucket.blocked_until, bucket.reset_at)
+        except ValueError:
+            pass  # malformed header: keep the local estimate
+        
+        if status == 429:
+            if retry_after is None:
+                try:
+                    retry_after = float(headers.get('Retry-After', 1))
+                except ValueError:
+                    retry_after = 1.0
+            bucket.tokens = 0.0
+            bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+            if self.on_throttle is not None:
+                self.on_throttle(key)
+    
+    async def post(self, session: aiohttp.ClientSession, key: str, url: str, payload: Dict,
+                   timeout: float = 10, max_retries: int = 3) -> int:
+        """POST JSON within the destination's limit, retrying 429s after the advised delay.
+        
+        Returns the final HTTP status.
+        """
+        for attempt in range(max_retries + 1):
+            await self.acquire(key)
+            async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                retry_after = None
+                if response.status == 429:
+                    # Discord ({"retry_after": s}) and Telegram ({"parameters": {"retry_after": s}})
+                    try:
+                        body = await response.json(content_type=None)
+                        retry_after = body.get('retry_after') or body.get('parameters', {}).get('retry_after')
+                        retry_after = float(retry_after) if retry_after is not None else None
+                    except Exception:
+                        retry_after = None
+                self.record(key, response.status, response.headers, retry_after)
+                if response.status != 429 or attempt == max_retries:
+                    return response.status
+        return 429
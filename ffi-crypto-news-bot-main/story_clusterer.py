@@ -0,0 +1,154 @@
+"""
+Story Clusterer - Near-duplicate detection across feeds
+Headline word sets compared by Jaccard similarity of their bottom-k MinHash sketches
+"""
+
+import hashlib
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Words that carry no story identity; headlines differ mostly in these
+STOPWORDS = {
+    'a', 'an', 'the', 'of', 'to', 'in', 'on', 'for', 'and', 'or', 'as', 'at', 'by', 'with', 'from',
+    'is', 'are', 'was', 'were', 'be', 'has', 'have', 'its', 'it', 'this', 'that', 'after', 'over',
+    'new', 'says', 'said'
+}
+
+# Word hashes kept per title sketch; titles with fewer distinct words compare exactly
+SKETCH_SIZE = 16
+
+
+def tokens(text: str) -> List[str]:
+    """Lowercased content words with a trailing plural 's' removed ("etfs" -> "etf")."""
+    words = [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS]
+    return [word[:-1] if len(word) > 3 and word.endswith('s') else word for word in words]
+
+
+@lru_cache(maxsize=65536)
+def word_hash(word: str) -> int:
+    """Stable, nonzero 32-bit hash of a word.
+    
+    blake2b rather than hash(), which is salted per process. Cached because
+    the same words recur across articles and runs.
+    """
+    return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=4).digest(), 'big') or 1
+
+
+def title_sketch(title: str, size: int = SKETCH_SIZE) -> Tuple[int, ...]:
+    """Bottom-k MinHash of a headline: its size smallest distinct word hashes, ascending."""
+    return tuple(sorted({word_hash(word) for word in tokens(title)})[:size])
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...], size: int = SKETCH_SIZE) -> float:
+    """Jaccard similarity of two headlines' word sets, from their sketches.
+    
+    Exact while both headlines have fewer than size distinct words; beyond
+    that, the bottom-k estimate over the hashes both sketches cover.
+    """
+    if not a or not b:
+        return 0.0
+    if len(a) >= size or len(b) >= size:
+        cutoff = min(a[-1], b[-1])
+        a = [value for value in a if value <= cutoff]
+        b = [value for value in b if value <= cutoff]
+    shared = len(set(a) & set(b))
+    return shared / (len(a) + len(b) - shared)
+
+
+def sketch_prefix(sketch: Tuple[int, ...], min_similarity: float) -> Tuple[int, ...]:
+    """Leading hashes of a sketch that any sketch at min_similarity or more shares one of.
+    
+    Prefix filtering: sets with Jaccard >= t overlap in at least ceil(t * |x|)
+    elements, so their first |x| - ceil(t * |x|) + 1 elements in a common
+    order (here, hash order) intersect. Bucketing by these finds every
+    candidate pair without comparing all pairs.
+    """
+    return sketch[:len(sketch) - math.ceil(min_similarity * len(sketch) - 1e-9) + 1]
+
+
+class StoryClusterer:
+    """Groups articles that report the same story and keeps one representative per group.
+    
+    Reworded copies of one story merge; the same wording about another
+    company does not:
+    
+    >>> articles = [
+    ...     {'title': 'SEC sues Binance over unregistered securities', 'source': 'CoinDesk'},
+    ...     {'title': 'SEC sues Binance over unregistered securities offering', 'source': 'Decrypt'},
+    ...     {'title': 'SEC sues Coinbase over unregistered securities', 'source': 'The Block'},
+    ...     {'title': 'Ethereum developers set date for Pectra upgrade', 'source': 'CoinDesk'},
+    ...     {'title': 'Ethereum devs set Pectra upgrade date', 'source': 'Cointelegraph'},
+    ...     {'title': 'Ethereum devs set Pectra upgrade date', 'source': 'CoinDesk'}]
+    >>> for index, article in enumerate(articles):
+    ...     article.update(link=str(index), credibility=3)
+    >>> [(story['link'], story.get('duplicate_links', [])) for story in StoryClusterer().cluster(articles)]
+    [('0', ['1']), ('2', []), ('3', ['4']), ('5', [])]
+    """
+    
+    def __init__(self, min_similarity: float = 0.7):
+        """Articles whose headlines share at least min_similarity of their words (Jaccard) are one story.
+        
+        Above 1, nothing is clustered.
+        """
+        self.min_similarity = min_similarity
+    
+    def cluster(self, articles: List[Dict]) -> List[Dict]:
+        """Collapse near-duplicates, keeping the highest-credibility article of each story.
+        
+        The representative gains 'also_reported_by' (other sources) and
+        'duplicate_links' (links of the dropped copies). Input order is kept.
+        A story takes at most one article per source: an outlet does not
+        syndicate itself, so two close headlines from one feed are two stories.
+        """
+        if len(articles) < 2 or self.min_similarity > 1:
+            return articles
+        
+        # Each article joins the first story whose seed (first article) is close
+        # enough; comparing against seeds only keeps stories from chaining together
+        seeds: List[Tuple[int, ...]] = []
+        sources: List[set] = []  # per story
+        groups: Dict[int, List[int]] = {}
+        buckets: Dict[int, List[int]] = {}  # word hash in a seed's prefix -> stories
+        for index, article in enumerate(articles):
+            sketch = article.get('sketch')
+            if sketch is None:
+                sketch = title_sketch(article['title'])
+            prefix = sketch_prefix(sketch, self.min_similarity)
+            
+            story = None
+            for value in prefix:
+                for candidate in buckets.get(value, ()):
+                    if (article['source'] not in sources[candidate] and
+                            similarity(seeds[candidate], sketch) >= self.min_similarity):
+                        story = candidate
+                        break
+                if story is not None:
+                    break
+            
+            if story is None:
+                story = len(seeds)
+                seeds.append(sketch)
+                sources.append(set())
+                for value in prefix:
+                    buckets.setdefault(value, []).append(story)
+            sources[story].add(article['source'])
+            groups.setdefault(story, []).append(index)
+        
+        representatives = []
+        for members in groups.values():
+            # Highest credibility wins; the earliest in feed order breaks ties
+            keep = max(members, key=lambda index: (articles[index]['credibility'], -index))
+            article = articles[keep]
+            if len(members) > 1:
+                others = [articles[index] for index in members if index != keep]
+                article['also_reported_by'] = list(dict.fromkeys(
+                    other['source'] for other in others if other['source'] != article['source']
+                ))
+                article['duplicate_links'] = [other['link'] for other in others if other['link'] != article['link']]
+            representatives.append(keep)
+        
+        return [articles[index] for index in sorted(representatives)]
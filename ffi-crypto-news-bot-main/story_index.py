@@ -0,0 +1,169 @@
+"""
+Story Index - On-disk headline sketches of delivered articles
+Fixed-size binary records read through mmap, with prefix-bucket lookup for near-duplicate checks
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from story_clusterer import SKETCH_SIZE, similarity, sketch_prefix
+
+# One record per delivered article: epoch seconds added, then the sketch's word hashes (0-padded)
+RECORD = struct.Struct(f'<I{SKETCH_SIZE}I')
+
+
+class StoryIndex:
+    """Near-duplicate lookup over headline sketches of articles delivered within the last window_days.
+    
+    Reposts under a new URL are found whatever their summary says:
+    
+    >>> from story_clusterer import title_sketch
+    >>> index = StoryIndex(os.devnull)
+    >>> index.add(title_sketch('Bitcoin ETF sees record $1B inflows'))
+    >>> title_sketch('Bitcoin ETF sees record $1B inflows') in index
+    True
+    >>> title_sketch('Bitcoin ETF sees record $1B inflows: Report') in index
+    True
+    >>> title_sketch('Ether ETF sees record $1B inflows') in index
+    False
+    
+    Records older than the window are dropped on load, and the file is
+    rewritten once they outnumber the live ones:
+    
+    >>> import tempfile
+    >>> tmp = tempfile.TemporaryDirectory()
+    >>> path = os.path.join(tmp.name, 'stories.bin')
+    >>> index = StoryIndex(path, window_days=14)
+    >>> for title in ['Solana outage halts block production', 'Kraken lists PEPE futures']:
+    ...     index.add(title_sketch(title), timestamp=time.time() - 20 * 86400)
+    >>> index.add(title_sketch('Bitcoin ETF sees record $1B inflows'))
+    >>> index.flush(), os.path.getsize(path) == 3 * RECORD.size
+    (3, True)
+    >>> index = StoryIndex(path, window_days=14)
+    >>> len(index), title_sketch('Solana outage halts block production') in index
+    (1, False)
+    >>> index.flush(), os.path.getsize(path) == RECORD.size
+    (1, True)
+    
+    A record torn by an interrupted run is ignored and overwritten by the
+    next append, so later records stay aligned:
+    
+    >>> with open(path, 'ab') as f:
+    ...     _ = f.write(b'torn')
+    >>> index = StoryIndex(path)
+    >>> index.add(title_sketch('SEC sues Binance over unregistered securities'))
+    >>> index.flush(), os.path.getsize(path) == 2 * RECORD.size
+    (1, True)
+    >>> title_sketch('SEC sues Binance over unregistered securities: Report') in StoryIndex(path)
+    True
+    >>> tmp.cleanup()
+    """
+    
+    def __init__(self, path: str, window_days: int = 14, min_similarity: float = 0.8):
+        """Configure the index. Nothing is read from disk until the first lookup."""
+        self.path = path
+        self.window_seconds = window_days * 86400
+        self.min_similarity = min_similarity
+        
+        self._sketches: Optional[List[Tuple[int, ...]]] = None  # live sketches
+        self._added: List[int] = []  # epoch seconds, parallel to _sketches
+        self._buckets: Dict[int, List[int]] = {}  # word hash in a sketch's prefix -> positions in _sketches
+        self._pending: List[bytes] = []  # records not yet appended to disk
+        self._expired_records = 0  # records in the file that fell out of the window
+        self._lock = threading.Lock()  # parse workers look up while the event loop adds
+    
+    def _load(self):
+        """Map the file and index the records still inside the window."""
+        if self._sketches is not None:
+            return
+        
+        self._sketches = []
+        cutoff = time.time() - self.window_seconds
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= RECORD.size:
+            with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                # A trailing partial record is a torn write from an interrupted run
+                usable = len(view) - len(view) % RECORD.size
+                with memoryview(view)[:usable] as records:
+                    for added, *hashes in RECORD.iter_unpack(records):
+                        if added < cutoff:
+                            self._expired_records += 1
+                        else:
+                            self._insert(tuple(value for value in hashes if value), added)
+    
+    def _insert(self, sketch: Tuple[int, ...], added: int):
+        """Add a sketch to the in-memory arrays and prefix buckets."""
+        position = len(self._sketches)
+        self._sketches.append(sketch)
+        self._added.append(added)
+        for value in sketch_prefix(sketch, self.min_similarity):
+            self._buckets.setdefault(value, []).append(position)
+    
+    def find(self, sketch: Iterable[int]) -> Optional[Tuple[int, ...]]:
+        """Return a stored sketch at min_similarity or above, or None.
+        
+        Only sketches sharing a prefix word hash with the candidate are compared.
+        """
+        sketch = tuple(sketch)
+        with self._lock:
+            self._load()
+            for value in sketch_prefix(sketch, self.min_similarity):
+                for position in self._buckets.get(value, ()):
+                    if similarity(self._sketches[position], sketch) >= self.min_similarity:
+                        return self._sketches[position]
+            return None
+    
+    def __contains__(self, sketch: Iterable[int]) -> bool:
+        return self.find(sketch) is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._sketches)
+    
+    def add(self, sketch: Iterable[int], timestamp: Optional[float] = None):
+        """Record the sketch of a delivered article (kept in memory until flush)."""
+        sketch = tuple(sketch)[:SKETCH_SIZE]
+        with self._lock:
+            self._load()
+            added = int(time.time() if timestamp is None else timestamp)
+            self._insert(sketch, added)
+            self._pending.append(self._pack(sketch, added))
+    
+    @staticmethod
+    def _pack(sketch: Tuple[int, ...], added: int) -> bytes:
+        return RECORD.pack(added, *sketch, *[0] * (SKETCH_SIZE - len(sketch)))
+    
+    def flush(self) -> int:
+        """Append new records, or rewrite the file once most of it is out of the window.
+        
+        Returns the number of records written.
+        """
+        with self._lock:
+            if self._sketches is None:
+                return 0
+            
+            if self._expired_records > len(self._sketches):
+                return self._compact()
+            
+            if self._pending:
+                with open(self.path, 'ab') as f:
+                    f.truncate(f.tell() - f.tell() % RECORD.size)  # drop a torn trailing record
+                    f.write(b''.join(self._pending))
+            written = len(self._pending)
+            self._pending = []
+            return written
+    
+    def _compact(self) -> int:
+        """Rewrite the file with only the records inside the window."""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(b''.join(self._pack(sketch, added) for sketch, added in zip(self._sketches, self._added)))
+        os.replace(temp_path, self.path)
+        
+        self._expired_records = 0
+        self._pending = []
+        return len(self._sketches)
@@ -0,0 +1,89 @@
+"""
+Translation Cache - Persistent SQLite cache for OpenAI translations
+Entries are keyed by a hash of source text, model and system prompt
+"""
+
+import hashlib
+import sqlite3
+import time
+from typing import Dict, Optional
+
+
+class TranslationCache:
+    """On-disk translation cache with LRU and TTL eviction."""
+    
+    def __init__(self, path: str, max_entries: int = 5000, ttl_days: int = 30):
+        """Open (or create) the cache database."""
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+        
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " key TEXT PRIMARY KEY,"
+            " translation TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)")
+        self.db.commit()
+    
+    @staticmethod
+    def make_key(text: str, model: str, system_prompt: str) -> str:
+        """Hash the inputs that determine a translation."""
+        digest = hashlib.sha256()
+        for part in (model, system_prompt, text):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def get(self, text: str, model: str, system_prompt: str) -> Optional[str]:
+        """Return a cached translation, or None on a miss or expired entry."""
+        key = self.make_key(text, model, system_prompt)
+        now = time.time()
+        row = self.db.execute(
+            "SELECT translation, created_at FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+        
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        
+        self.db.execute("UPDATE translations SET last_used = ? WHERE key = ?", (now, key))
+        self.db.commit()
+        self.hits += 1
+        return row[0]
+    
+    def put(self, text: str, model: str, system_prompt: str, translation: str):
+        """Store a translation."""
+        key = self.make_key(text, model, system_prompt)
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO translations (key, translation, created_at, last_used) VALUES (?, ?, ?, ?)",
+            (key, translation, now, now)
+        )
+        self.db.commit()
+    
+    def prune(self) -> int:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        cutoff = time.time() - self.ttl_seconds
+        removed = self.db.execute("DELETE FROM translations WHERE created_at < ?", (cutoff,)).rowcount
+        removed += self.db.execute(
+            "DELETE FROM translations WHERE key NOT IN "
+            "(SELECT key FROM translations ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,)
+        ).rowcount
+        self.db.commit()
+        return removed
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process plus the current entry count."""
+        entries = self.db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+    
+    def close(self):
+        """Close the database connection."""
+        self.db.close()
@@ -123,8 +123,8 @@ class PortfolioTrackerV2:
             print(f"Error loading portfolio: {e}")
             return {}
     
-    async def fetch_prices(self, symbols: List[str]) -> Dict[str, float]:
-        """Fetch current prices from CoinGecko."""
+    async def fetch_prices(self, symbols: List[str], session: Optional[aiohttp.ClientSession] = None) -> Dict[str, float]:
+        """Fetch current prices from CoinGecko, reusing a shared HTTP session if given."""
         # Map symbols to CoinGecko IDs (simplified mapping)
         symbol_to_id = {
             'BTC': 'bitcoin',
@@ -172,22 +172,25 @@ class PortfolioTrackerV2:
             if self.coingecko_api_key:
                 headers['x-cg-pro-api-key'] = self.coingecko_api_key
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Map back to symbols
-                        prices = {}
-                        for symbol, cg_id in symbol_to_id.items():
-                            if cg_id in data:
-                                prices[symbol] = data[cg_id]['usd']
-                        
-                        return prices
-                    else:
-                        print(f"CoinGecko API error: {response.status}")
-                        return {}
-                        
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    return await self.fetch_prices(symbols, own_session)
+            
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    # Map back to symbols
+                    prices = {}
+                    for symbol, cg_id in symbol_to_id.items():
+                        if cg_id in data:
+                            prices[symbol] = data[cg_id]['usd']
+                    
+                    return prices
+                else:
+                    print(f"CoinGecko API error: {response.status}")
+                    return {}
+                    
         except Exception as e:
             print(f"Error fetching prices: {e}")
             return {}